@@ -1,4 +1,6 @@
 # -*- coding: utf-8 -*-
+import asyncio
+import aiohttp
 import requests
 from datetime import datetime
 from .version_processor import VersionProcessor
@@ -23,6 +25,9 @@ class AurCheckerModule:
         # AUR RPC API地址
         self.aur_rpc_url = "https://aur.archlinux.org/rpc/v5/info"
 
+        # 批量查询时每个请求包含的软件包数量
+        self.batch_size = 150
+
     async def check_aur_version(self, package_name, callback=None):
         """检查单个软件包的 AUR 版本
 
@@ -111,9 +116,83 @@ class AurCheckerModule:
                 "success": False
             }
 
+    async def _fetch_aur_batch(self, session, batch, batch_index):
+        """查询一批软件包的 AUR 信息
+
+        Args:
+            session: aiohttp会话
+            batch: 本批次的软件包名称列表
+            batch_index: 批次序号，仅用于日志
+
+        Returns:
+            list: 本批次各个软件包的版本信息
+        """
+        self.logger.debug(f"处理批次 {batch_index}，包含 {len(batch)} 个包")
+
+        # AUR API支持多个"arg[]"参数进行批量查询
+        params = [("arg[]", pkg) for pkg in batch]
+        async with session.get(self.aur_rpc_url, params=params) as response:
+            if response.status != 200:
+                self.logger.error(f"AUR API 请求失败，状态码: {response.status}")
+                return []
+            data = await response.json(content_type=None)
+
+        if data.get("type") != "multiinfo" or not data.get("results"):
+            self.logger.warning(f"批次 {batch_index} 没有返回结果")
+            return []
+
+        # 处理返回的包信息
+        aur_packages = {pkg["Name"].lower(): pkg for pkg in data["results"]}
+        results = []
+
+        # 更新数据库并构建结果
+        for package_name in batch:
+            pkg_info = aur_packages.get(package_name.lower())
+
+            if pkg_info is None:
+                # 未找到包
+                results.append({
+                    "name": package_name,
+                    "found": False,
+                    "message": "在 AUR 中未找到该软件包",
+                    "success": True  # 查询成功，只是没找到包
+                })
+                continue
+
+            version_info = self._parse_version_string(pkg_info.get("Version", ""))
+
+            # 更新数据库
+            if self.db_module:
+                try:
+                    self.db_module.update_aur_version(
+                        pkg_info["Name"],
+                        version_info["version"],
+                        version_info["epoch"],
+                        version_info["release"]
+                    )
+                except Exception as db_error:
+                    self.logger.error(f"更新数据库中 {package_name} 的 AUR 版本信息时出错: {str(db_error)}")
+
+            # 添加到结果
+            results.append({
+                "name": pkg_info["Name"],
+                "found": True,
+                "version": version_info["version"],
+                "epoch": version_info["epoch"],
+                "release": version_info["release"],
+                "last_modified": pkg_info.get("LastModified") and
+                                datetime.fromtimestamp(pkg_info["LastModified"]).isoformat(),
+                "success": True
+            })
+
+        self.logger.info(f"批次 {batch_index} 处理完成")
+        return results
+
     async def check_multiple_aur_versions(self, package_names):
         """批量检查多个软件包的 AUR 版本，使用AUR API的批量查询功能
 
+        软件包按批次拆分为多个请求，所有批次并发发出。
+
         Args:
             package_names: 软件包名称列表
 
@@ -126,83 +205,27 @@ class AurCheckerModule:
 
         self.logger.info(f"开始批量检查 {len(package_names)} 个 AUR 软件包")
 
-        # AUR API 每次请求限制包数量，将包列表分批处理
-        batch_size = 50  # AUR API支持的最大批量查询数量
+        # AUR API 每次请求限制包数量（受URL长度约束），将包列表分批处理
+        batch_size = self.batch_size
+        batches = [package_names[i:i + batch_size] for i in range(0, len(package_names), batch_size)]
         results = []
 
         try:
-            # 分批处理包
-            for i in range(0, len(package_names), batch_size):
-                batch = package_names[i:i+batch_size]
-                self.logger.debug(f"处理批次 {i//batch_size + 1}，包含 {len(batch)} 个包")
-
-                # 构建查询参数 - AUR API支持多个"arg[]"参数进行批量查询
-                params = []
-                for pkg in batch:
-                    params.append(("arg[]", pkg))
-
-                # 查询 AUR API
-                response = requests.get(
-                    self.aur_rpc_url,
-                    params=params,
-                    timeout=15  # 批量查询给予更多时间
+            # 每次批量检查使用一个会话，所有批次共享，结束时自动关闭
+            async with aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=15)  # 批量查询给予更多时间
+            ) as session:
+                batch_results = await asyncio.gather(
+                    *[self._fetch_aur_batch(session, batch, index + 1) for index, batch in enumerate(batches)],
+                    return_exceptions=True
                 )
 
-                if response.status_code != 200:
-                    self.logger.error(f"AUR API 请求失败，状态码: {response.status_code}")
+            # 按批次顺序合并结果，单个批次失败不影响其他批次
+            for index, batch_result in enumerate(batch_results):
+                if isinstance(batch_result, Exception):
+                    self.logger.error(f"批次 {index + 1} 查询 AUR 时出错: {str(batch_result)}")
                     continue
-
-                data = response.json()
-
-                if data["type"] != "multiinfo" or not data["results"]:
-                    self.logger.warning(f"批次 {i//batch_size + 1} 没有返回结果")
-                    continue
-
-                # 处理返回的包信息
-                aur_packages = {pkg["Name"].lower(): pkg for pkg in data["results"]}
-
-                # 更新数据库并构建结果
-                for package_name in batch:
-                    lower_name = package_name.lower()
-
-                    if lower_name in aur_packages:
-                        # 找到包
-                        pkg_info = aur_packages[lower_name]
-                        version_info = self._parse_version_string(pkg_info.get("Version", ""))
-
-                        # 更新数据库
-                        if self.db_module:
-                            try:
-                                self.db_module.update_aur_version(
-                                    pkg_info["Name"],
-                                    version_info["version"],
-                                    version_info["epoch"],
-                                    version_info["release"]
-                                )
-                            except Exception as db_error:
-                                self.logger.error(f"更新数据库中 {package_name} 的 AUR 版本信息时出错: {str(db_error)}")
-
-                        # 添加到结果
-                        results.append({
-                            "name": pkg_info["Name"],
-                            "found": True,
-                            "version": version_info["version"],
-                            "epoch": version_info["epoch"],
-                            "release": version_info["release"],
-                            "last_modified": pkg_info.get("LastModified") and
-                                            datetime.fromtimestamp(pkg_info["LastModified"]).isoformat(),
-                            "success": True
-                        })
-                    else:
-                        # 未找到包
-                        results.append({
-                            "name": package_name,
-                            "found": False,
-                            "message": "在 AUR 中未找到该软件包",
-                            "success": True  # 查询成功，只是没找到包
-                        })
-
-                self.logger.info(f"批次 {i//batch_size + 1} 处理完成")
+                results.extend(batch_result)
 
             self.logger.info(f"批量检查 AUR 完成，共 {len(results)} 个软件包")
             return results
@@ -211,8 +234,6 @@ class AurCheckerModule:
             self.logger.error(f"批量检查 AUR 版本时发生错误: {str(error)}")
             return results  # 返回已处理的结果
 
-
-
     def _parse_version_string(self, version_str):
         """解析版本字符串 (epoch:version-release)
 
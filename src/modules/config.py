@@ -22,6 +22,8 @@ class ConfigModule:
         
         # 获取配置文件路径
         self.config_dir, self.config_file = self._get_config_paths()
+        # 内存中是否存在尚未写入文件的修改
+        self._unsaved = False
         self.config = self._load_default_config()
 
         # 确保配置目录存在
@@ -29,7 +31,18 @@ class ConfigModule:
 
         # 加载用户配置
         self._load_config()
-        
+
+    @property
+    def config(self):
+        """完整配置字典"""
+        return self._config
+
+    @config.setter
+    def config(self, value):
+        # 整体替换配置时清空查询缓存
+        self._config = value
+        self._get_cache = {}
+
     def _get_config_paths(self):
         """获取配置文件路径，优先级：命令行参数 > 环境变量 > 默认路径
         
@@ -266,6 +279,7 @@ class ConfigModule:
                 else:
                     os.rename(temp_file, self.config_file)
                 
+                self._unsaved = False
                 self.logger.info(f"配置已成功保存到 {self.config_file}")
                 return True
             except Exception as e:
@@ -281,6 +295,16 @@ class ConfigModule:
             self.logger.error(f"保存配置过程中发生严重错误: {str(e)}")
             return False
 
+    def flush(self):
+        """将内存中尚未写入文件的配置修改保存到文件
+
+        Returns:
+            bool: 无待保存修改或保存成功时返回True
+        """
+        if not self._unsaved:
+            return True
+        return self._save_config()
+
     def _merge_configs(self, target, source):
         """深度合并配置对象
 
@@ -311,6 +335,12 @@ class ConfigModule:
         Returns:
             配置值
         """
+        # 已解析过的键直接返回缓存结果，任何写入都会清空缓存
+        try:
+            return self._get_cache[key]
+        except KeyError:
+            pass
+
         keys = key.split('.')
         value = self.config
 
@@ -319,6 +349,7 @@ class ConfigModule:
                 return default_value
             value = value[k]
 
+        self._get_cache[key] = value
         return value
 
     def set(self, key, value, auto_save=False):
@@ -342,7 +373,41 @@ class ConfigModule:
             current = current[k]
 
         current[keys[-1]] = value
-        
+        self._get_cache.clear()
+        self._unsaved = True
+
+        if auto_save:
+            self._save_config()
+
+        return self
+
+    def set_many(self, updates, auto_save=False):
+        """批量设置配置
+
+        Args:
+            updates: 以点号分隔键为键的配置字典
+            auto_save: 是否自动保存配置，默认为False
+
+        Returns:
+            ConfigModule: 返回自身, 支持链式调用
+        """
+        # 缓存已定位的父节点，同一前缀只遍历一次
+        parents = {}
+        for key, value in updates.items():
+            prefix, _, leaf = key.rpartition('.')
+            current = parents.get(prefix)
+            if current is None:
+                current = self.config
+                if prefix:
+                    for k in prefix.split('.'):
+                        if k not in current or not isinstance(current[k], dict):
+                            current[k] = {}
+                        current = current[k]
+                parents[prefix] = current
+            current[leaf] = value
+        self._get_cache.clear()
+        self._unsaved = True
+
         if auto_save:
             self._save_config()
 
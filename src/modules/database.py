@@ -36,6 +36,8 @@ class DatabaseModule:
         self._cache_ttl = self.config.get('database.cache_ttl', 60)  # 缓存有效期（秒）
         self._query_cache = {}  # 查询缓存
         self._cache_lock = threading.RLock()
+        self._all_packages_cache = None  # get_all_packages转换后的结果，写入软件包表时失效
+        self._packages_generation = 0  # 软件包缓存的版本号，每次清除缓存时递增
 
         # 获取数据库文件路径
         self.db_file_path = self.config.get('database.path', 
@@ -302,14 +304,16 @@ class DatabaseModule:
                 if time.time() - timestamp <= self._cache_ttl:
                     self.logger.debug(f"使用缓存结果: {cache_key[:50]}...")
                     return result
-        
+            generation = self._packages_generation
+
         # 执行查询
         cursor = self.execute(query, params)
         result = cursor.fetchall()
         
-        # 缓存结果
+        # 缓存结果，查询期间其他线程写入过软件包表时不缓存，避免保存写入前的旧数据
         with self._cache_lock:
-            self._query_cache[cache_key] = (result, time.time())
+            if generation == self._packages_generation:
+                self._query_cache[cache_key] = (result, time.time())
             
         return result
 
@@ -320,15 +324,25 @@ class DatabaseModule:
             list: 软件包列表，每个元素为一个字典
         """
         try:
-            # 使用缓存查询
-            rows = self.execute_cached("SELECT * FROM packages ORDER BY name")
+            with self._cache_lock:
+                packages = self._all_packages_cache
+                generation = self._packages_generation
 
-            # 将sqlite3.Row对象转换为字典列表
-            packages = []
-            for row in rows:
-                packages.append({key: row[key] for key in row.keys()})
+            if packages is None:
+                # 使用缓存查询
+                rows = self.execute_cached("SELECT * FROM packages ORDER BY name")
+
+                # 将sqlite3.Row对象转换为字典列表
+                packages = [{key: row[key] for key in row.keys()} for row in rows]
+
+                if self._enable_cache:
+                    with self._cache_lock:
+                        # 查询期间缓存被清除过，说明结果可能已过时，只返回不缓存
+                        if generation == self._packages_generation:
+                            self._all_packages_cache = packages
 
-            return packages
+            # 调用方会修改返回的字典，返回浅拷贝以保护缓存
+            return [dict(package) for package in packages]
         except Exception as e:
             self.logger.error(f"获取所有软件包失败: {str(e)}")
             return []
@@ -419,6 +433,9 @@ class DatabaseModule:
             """
             cursor = self.execute(sql, (name, upstream_url, checker_type, version_extract_key, notes, now, now))
 
+            # 清除相关缓存
+            self._clear_packages_cache()
+
             # 返回插入的记录
             new_package = {
                 'name': name,
@@ -488,6 +505,9 @@ class DatabaseModule:
             params.append(name)
             cursor = self.execute(sql, tuple(params))
 
+            # 清除相关缓存
+            self._clear_packages_cache()
+
             if cursor.rowcount == 0:
                 self.logger.warning(f"更新软件包失败: 未找到软件包 {name}")
                 return None
@@ -509,6 +529,9 @@ class DatabaseModule:
         try:
             cursor = self.execute("DELETE FROM packages WHERE name = ?", (name,))
 
+            # 清除相关缓存
+            self._clear_packages_cache()
+
             if cursor.rowcount == 0:
                 self.logger.warning(f"删除软件包失败: 未找到软件包 {name}")
                 return False
@@ -531,7 +554,21 @@ class DatabaseModule:
         Returns:
             int: 成功更新的记录数，如果失败则返回0
         """
-        return self.update_multiple_aur_versions([{"name": name, "version": aur_version}]) if name and aur_version else 0
+        if not name or not aur_version:
+            return 0
+
+        # 单个软件包直接执行一条UPDATE，不经过批量接口的参数列表
+        try:
+            now = datetime.now().isoformat()
+            cursor = self.execute(
+                "UPDATE packages SET aur_version = ?, aur_update_date = ?, updated_at = ? WHERE name = ?",
+                (aur_version, now, now, name)
+            )
+            self._clear_packages_cache()
+            return cursor.rowcount
+        except Exception as e:
+            self.logger.error(f"更新 AUR 版本失败: {str(e)}")
+            return 0
             
     def update_multiple_aur_versions(self, package_updates):
         """批量更新多个软件包的 AUR 版本信息
@@ -587,6 +624,30 @@ class DatabaseModule:
         """
         return self.update_multiple_upstream_versions([{"name": name, "version": upstream_version}]) if name and upstream_version else 0
             
+    def touch_upstream_check_time(self, name):
+        """只更新软件包的上游检查时间，版本保持不变
+
+        Args:
+            name: 软件包名称
+
+        Returns:
+            int: 更新的行数，或0表示失败
+        """
+        if not name:
+            return 0
+
+        try:
+            now = datetime.now().isoformat()
+            cursor = self.execute(
+                "UPDATE packages SET upstream_update_date = ?, updated_at = ? WHERE name = ?",
+                (now, now, name)
+            )
+            self._clear_packages_cache()
+            return cursor.rowcount
+        except Exception as e:
+            self.logger.error(f"更新上游检查时间失败: {str(e)}")
+            return 0
+
     def update_multiple_upstream_versions(self, package_updates):
         """批量更新多个软件包的上游版本信息
 
@@ -635,6 +696,9 @@ class DatabaseModule:
             return
             
         with self._cache_lock:
+            self._all_packages_cache = None
+            self._packages_generation += 1
+
             keys_to_remove = []
             for key in self._query_cache.keys():
                 if "FROM packages" in key:
@@ -700,6 +764,9 @@ class DatabaseModule:
             shutil.copy2(backup_path, self.db_file_path)
             self.logger.info(f"数据库已从 {backup_path} 恢复")
 
+            # 数据已整体替换，清除相关缓存
+            self._clear_packages_cache()
+
             # 重新连接数据库
             return self.initialize_database()
         except Exception as e:
@@ -754,6 +821,9 @@ class DatabaseModule:
             shutil.copy2(backup_path, self.db_file_path)
             self.logger.info(f"数据库已从 {backup_path} 恢复")
 
+            # 数据已整体替换，清除相关缓存
+            self._clear_packages_cache()
+
             # 重新连接数据库
             return self.initialize_database()
         except Exception as e:
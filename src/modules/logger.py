@@ -280,6 +280,21 @@ class LoggerModule:
                 return name
         return "UNKNOWN"
 
+    def is_enabled_for(self, level):
+        """判断指定级别的日志是否会被记录
+
+        用于在构造开销较大的日志消息之前提前判断
+
+        Args:
+            level: 日志级别名称或数值，例如 'DEBUG' 或 10
+
+        Returns:
+            bool: 该级别的日志是否会被记录
+        """
+        if isinstance(level, str):
+            level = self.LOG_LEVELS.get(level.upper(), 0)
+        return level >= self.current_log_level
+
     def add_to_recent_logs(self, level, message, extra=None):
         """添加日志到最近的日志列表，支持结构化数据
 
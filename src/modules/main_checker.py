@@ -11,6 +11,7 @@ from .checkers.upstream_playwright_checker import UpstreamPlaywrightChecker
 from .checkers.upstream_npm_checker import UpstreamNpmChecker
 from .aur_checker import AurCheckerModule
 from .version_processor import VersionProcessor
+import asyncio
 import re
 
 class MainCheckerModule:
@@ -251,8 +252,6 @@ class MainCheckerModule:
         """
         self.logger.info(f"开始批量检查 {len(packages_info)} 个软件包的上游版本")
 
-        import asyncio
-
         # 优化：批量预加载AUR版本数据
         package_names = [pkg.get("name") for pkg in packages_info if pkg.get("name")]
         if package_names:
@@ -275,27 +274,33 @@ class MainCheckerModule:
             except Exception as e:
                 self.logger.error(f"预加载软件包数据失败: {str(e)}")
 
-        # 创建所有检查任务
-        tasks = []
-        for package_info in packages_info:
-            # 直接调用check_single_upstream_version，并添加内联异常处理
-            async def safe_check(pkg_info):
-                try:
-                    return await self.check_single_upstream_version(pkg_info)
-                except Exception as error:
-                    name = pkg_info.get("name", "unknown")
-                    self.logger.error(f"检查软件包 {name} 版本时发生未捕获的异常: {str(error)}")
-                    return {
-                        "name": name,
-                        "success": False,
-                        "message": f"检查过程发生异常: {str(error)}"
-                    }
-
-            task = asyncio.create_task(safe_check(package_info))
-            tasks.append(task)
-
-        # 并发执行所有任务
-        results = await asyncio.gather(*tasks)
+        # 同时进行的检查数量受system.concurrent_checks限制，避免一次性向网络发起所有请求
+        concurrent_checks = self.config.get("system.concurrent_checks", 5) if self.config is not None else 5
+        worker_count = min(max(1, int(concurrent_checks or 1)), len(packages_info))
+
+        # 直接调用check_single_upstream_version，并添加内联异常处理
+        async def safe_check(pkg_info):
+            try:
+                return await self.check_single_upstream_version(pkg_info)
+            except Exception as error:
+                name = pkg_info.get("name", "unknown")
+                self.logger.error(f"检查软件包 {name} 版本时发生未捕获的异常: {str(error)}")
+                return {
+                    "name": name,
+                    "success": False,
+                    "message": f"检查过程发生异常: {str(error)}"
+                }
+
+        # 固定数量的工作协程轮流从同一个迭代器中取软件包，只创建worker_count个任务
+        results = [None] * len(packages_info)
+        pending = iter(enumerate(packages_info))
+
+        async def worker():
+            for index, package_info in pending:
+                results[index] = await safe_check(package_info)
+
+        if worker_count:
+            await asyncio.gather(*(worker() for _ in range(worker_count)))
 
         self.logger.info(f"批量检查上游完成，共 {len(results)} 个软件包")
         return results
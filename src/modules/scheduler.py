@@ -3,7 +3,7 @@
 定时检查模块，负责管理定时检查任务
 """
 from datetime import datetime, timedelta
-from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtCore import QObject, QTimer, Signal, Slot
 
 class SchedulerModule(QObject):
     """定时检查模块，负责管理定时检查任务"""
@@ -37,6 +37,9 @@ class SchedulerModule(QObject):
         # 初始化状态
         self.is_initialized = False
 
+        # 关闭请求标志，设置后计时器回调不再发出检查信号
+        self._stop_requested = False
+
         # 应用配置
         self.apply_config()
 
@@ -93,6 +96,7 @@ class SchedulerModule(QObject):
             # 或者等待定时器触发
 
         # 启动计时器
+        self._stop_requested = False
         self.aur_timer.start()
         self.upstream_timer.start()
 
@@ -100,11 +104,19 @@ class SchedulerModule(QObject):
         self.logger.info("定时检查已启动")
 
     def stop(self):
-        """停止定时检查"""
+        """停止定时检查
+
+        只设置关闭标志并停止计时器，不等待正在进行的检查，立即返回；
+        关闭窗口和应用退出（aboutToQuit）时都会调用，已停止时直接返回
+        """
+        if self._stop_requested:
+            return
+        self._stop_requested = True
         self.aur_timer.stop()
         self.upstream_timer.stop()
         self.logger.info("定时检查已停止")
 
+    @Slot()
     def check_now(self, check_type="all"):
         """立即执行检查
 
@@ -155,6 +167,8 @@ class SchedulerModule(QObject):
 
     def _on_aur_timer_timeout(self):
         """AUR计时器超时处理"""
+        if self._stop_requested:
+            return
         self.logger.info(f"AUR检查计时器触发，间隔: {self.aur_check_interval}小时")
         self.aur_check_required.emit()
         self.last_aur_check = datetime.now()
@@ -164,6 +178,8 @@ class SchedulerModule(QObject):
 
     def _on_upstream_timer_timeout(self):
         """上游计时器超时处理"""
+        if self._stop_requested:
+            return
         self.logger.info(f"上游检查计时器触发，间隔: {self.upstream_check_interval}小时")
         self.upstream_check_required.emit()
         self.last_upstream_check = datetime.now()
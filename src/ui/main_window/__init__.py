@@ -8,9 +8,8 @@ from .ui_init import UIInitMixin
 from .update_ui import UpdateUIMixin
 from .version_check import VersionCheckMixin
 from .package_filtering import PackageFiltering
-from .table_operations import TableOperations
+from .package_table_model import PackageTableModel
 from .ui_buttons import UIButtons
-from .utils import run_async
 
 # 兼容导入，使用MainWindowWrapper作为MainWindow
 MainWindow = MainWindowWrapper
@@ -26,8 +25,7 @@ __all__ = [
     'UpdateUIMixin',
     'VersionCheckMixin',
     'PackageFiltering',
-    'TableOperations',
-    'UIButtons',
-    'run_async'
+    'PackageTableModel',
+    'UIButtons'
 ]
 
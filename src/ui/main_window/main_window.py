@@ -3,13 +3,16 @@
 主窗口模块，整合其他所有模块
 """
 import os
-from PySide6.QtWidgets import QMainWindow, QMessageBox, QWidget, QVBoxLayout, QTabWidget
+from datetime import datetime
+from functools import partial
+from PySide6.QtWidgets import QApplication, QMainWindow, QMessageBox, QWidget, QVBoxLayout, QTabWidget, QHeaderView
 from PySide6.QtCore import Qt, QTimer
 from PySide6.QtGui import QIcon
 
 # 导入模块
 from ...modules.aur_checker import AurCheckerModule
 from ...modules.scheduler import SchedulerModule
+from ...modules.async_executor import run_async_task
 from .ui_buttons import UIButtons
 
 # 导入子模块
@@ -19,7 +22,7 @@ from .version_check import VersionCheckMixin
 from .update_ui import UpdateUIMixin
 from .system_tray import SystemTrayMixin
 from .package_filtering import PackageFiltering
-from .table_operations import TableOperations
+from .package_table_model import is_outdated
 from .table_sort import TableSortMixin
 
 # 导入自定义标签页
@@ -29,6 +32,34 @@ from ..logs_tab import LogsTab
 
 class MainWindowWrapper(QMainWindow, PackageOperationsMixin, UpdateUIMixin, SystemTrayMixin, VersionCheckMixin, TableSortMixin):
 
+    # 搜索/过滤条件变化后等待的毫秒数，期间的后续输入会重新计时
+    SEARCH_FILTER_DELAY_MS = 150
+
+    # 列可见性配置：(列索引, ui配置键, 默认是否显示)
+    _COLUMN_VISIBILITY_KEYS = (
+        (1, "show_name", True),                 # 名称列
+        (2, "show_aur_version", True),          # AUR版本列
+        (3, "show_upstream_version", True),     # 上游版本列
+        (4, "show_status", False),              # 状态列
+        (5, "show_aur_check_time", True),       # AUR检查时间列
+        (6, "show_upstream_check_time", True),  # 上游检查时间列
+        (7, "show_checker_type", True),         # 检查器类型列
+        (8, "show_upstream_url", False),        # 上游URL列
+        (9, "show_notes", False)                # 备注列
+    )
+
+    # 各检查类型的结果写入的版本字段和检查时间字段
+    _CHECK_RESULT_FIELDS = {
+        "AUR": ("aur_version", "aur_update_date"),
+        "上游": ("upstream_version", "upstream_update_date")
+    }
+
+    # 各检查类型的结果影响的列范围：从版本列到检查时间列，中间包含根据版本计算的状态列
+    _CHECK_RESULT_COLUMNS = {
+        "AUR": (2, 5),
+        "上游": (3, 6)
+    }
+
     def _connect_scheduler_signals(self):
         """连接定时检查模块的信号"""
         try:
@@ -41,6 +72,11 @@ class MainWindowWrapper(QMainWindow, PackageOperationsMixin, UpdateUIMixin, Syst
             # 启动定时检查
             self.scheduler.start()
 
+            # 通过托盘菜单等途径退出应用时也停止定时检查，窗口关闭时已停止则直接返回
+            app = QApplication.instance()
+            if app is not None:
+                app.aboutToQuit.connect(self.scheduler.stop)
+
             self.logger.info("已连接定时检查信号")
         except Exception as e:
             self.logger.error(f"连接定时检查信号时出错: {str(e)}")
@@ -60,14 +96,13 @@ class MainWindowWrapper(QMainWindow, PackageOperationsMixin, UpdateUIMixin, Syst
             self._init_version_services()
 
             # 使用批量方法一次性检查所有AUR版本
-            from src.modules.async_executor import run_async_task
             run_async_task(
                 self.aur_checker.check_multiple_aur_versions([p["name"] for p in packages]),
-                self._on_scheduled_aur_check_completed,
-                self._on_scheduled_aur_check_error
+                partial(self._on_scheduled_check_done, "AUR"),
+                partial(self._on_scheduled_check_error, "AUR")
             )
 
-            if hasattr(self, "status_label"):
+            if self.status_label is not None:
                 self.status_label.setText("正在执行定时AUR版本检查...")
 
         except Exception as e:
@@ -88,80 +123,104 @@ class MainWindowWrapper(QMainWindow, PackageOperationsMixin, UpdateUIMixin, Syst
             self._init_version_services()
 
             # 执行批量上游版本检查
-            from src.modules.async_executor import run_async_task
             run_async_task(
                 self.main_checker.check_multiple_upstream_versions(packages),
-                self._on_scheduled_upstream_check_completed,
-                self._on_scheduled_upstream_check_error
+                partial(self._on_scheduled_check_done, "上游"),
+                partial(self._on_scheduled_check_error, "上游")
             )
 
-            if hasattr(self, "status_label"):
+            if self.status_label is not None:
                 self.status_label.setText("正在执行定时上游版本检查...")
 
         except Exception as e:
             self.logger.error(f"执行定时上游检查时出错: {str(e)}")
 
-    def _on_scheduled_aur_check_completed(self, results):
-        """定时AUR版本检查完成的回调"""
+    def _on_scheduled_check_done(self, kind, results):
+        """定时版本检查完成的回调
+
+        Args:
+            kind: 检查类型名称，如 "AUR" 或 "上游"
+            results: 检查结果
+        """
         if not results:
-            self.logger.warning("AUR版本检查返回了空结果")
+            self.logger.warning(f"{kind}版本检查返回了空结果")
             return
 
-        self.logger.info(f"定时AUR版本检查完成: {len(results)}个结果")
+        self.logger.info(f"定时{kind}版本检查完成: {len(results)}个结果")
 
-        # 更新UI
-        self.load_packages()
+        # 只更新检查到的软件包所在行；有内存中不存在的软件包时才整体刷新
+        if not self._apply_check_results(results, kind):
+            # 合并短时间内的多次完成回调，只刷新一次表格
+            self._schedule_refresh()
 
         # 更新状态栏
-        if hasattr(self, "statusBar"):
-            self.statusBar().showMessage(f"AUR版本检查完成: {len(results)}个软件包", 5000)
+        self.statusBar().showMessage(f"{kind}版本检查完成: {len(results)}个软件包", 5000)
 
         # 更新标签
-        if hasattr(self, "status_label"):
+        if self.status_label is not None:
             self.status_label.setText("就绪")
 
-    def _on_scheduled_aur_check_error(self, error):
-        """定时AUR版本检查错误的回调"""
-        self.logger.error(f"定时AUR版本检查出错: {str(error)}")
+    def _on_scheduled_check_error(self, kind, error):
+        """定时版本检查错误的回调
+
+        Args:
+            kind: 检查类型名称，如 "AUR" 或 "上游"
+            error: 错误信息
+        """
+        self.logger.error(f"定时{kind}版本检查出错: {str(error)}")
 
         # 更新状态栏
-        if hasattr(self, "statusBar"):
-            self.statusBar().showMessage(f"AUR版本检查出错: {str(error)}", 5000)
+        self.statusBar().showMessage(f"{kind}版本检查出错: {str(error)}", 5000)
 
         # 更新标签
-        if hasattr(self, "status_label"):
+        if self.status_label is not None:
             self.status_label.setText("就绪")
 
-    def _on_scheduled_upstream_check_completed(self, results):
-        """定时上游版本检查完成的回调"""
-        if not results:
-            self.logger.warning("上游版本检查返回了空结果")
-            return
-
-        self.logger.info(f"定时上游版本检查完成: {len(results)}个结果")
-
-        # 更新UI
-        self.load_packages()
-
-        # 更新状态栏
-        if hasattr(self, "statusBar"):
-            self.statusBar().showMessage(f"上游版本检查完成: {len(results)}个软件包", 5000)
+    def _apply_check_results(self, results, kind):
+        """把检查结果直接写入内存中的软件包数据，只重绘受影响的行
 
-        # 更新标签
-        if hasattr(self, "status_label"):
-            self.status_label.setText("就绪")
+        Args:
+            results: 检查结果列表
+            kind: 检查类型名称，如 "AUR" 或 "上游"
 
-    def _on_scheduled_upstream_check_error(self, error):
-        """定时上游版本检查错误的回调"""
-        self.logger.error(f"定时上游版本检查出错: {str(error)}")
+        Returns:
+            bool: 所有结果都已应用时返回True，需要整体刷新时返回False
+        """
+        version_key, date_key = self._CHECK_RESULT_FIELDS[kind]
+        now = datetime.now().isoformat()
+        updated_names = set()
 
-        # 更新状态栏
-        if hasattr(self, "statusBar"):
-            self.statusBar().showMessage(f"上游版本检查出错: {str(error)}", 5000)
+        for result in results:
+            if not isinstance(result, dict) or not result.get("success"):
+                continue
+            version = result.get("version") or result.get("upstream_version")
+            if not version:
+                continue
+            pkg = self._packages_by_name.get(result.get("name"))
+            if pkg is None:
+                return False
+            pkg[version_key] = version
+            pkg[date_key] = now
+            updated_names.add(pkg["name"])
+
+        if updated_names:
+            # 数据已变化，下次过滤需要重新计算
+            self._pkg_cache_epoch += 1
+            # 状态由模型根据版本计算，版本、状态和检查时间在同一个dataChanged中更新
+            self.packages_model.refresh_packages(updated_names, *self._CHECK_RESULT_COLUMNS[kind])
+        return True
+
+    def _schedule_refresh(self):
+        """延迟刷新软件包列表，50毫秒内的多次请求只触发一次刷新"""
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        QTimer.singleShot(50, self._do_refresh)
 
-        # 更新标签
-        if hasattr(self, "status_label"):
-            self.status_label.setText("就绪")
+    def _do_refresh(self):
+        """执行延迟的软件包列表刷新"""
+        self._refresh_pending = False
+        self.load_packages()
 
     """
     主窗口类，整合所有功能模块
@@ -189,8 +248,59 @@ class MainWindowWrapper(QMainWindow, PackageOperationsMixin, UpdateUIMixin, Syst
         self.packages = []
         self.filtered_packages = []
 
-        # 初始化检查器模块
+        # 预先声明由init_ui/init_packages_tab/init_tray创建的控件，回调中用is not None判断
+        self.status_label = None
+        self.loading_progress = None
+        self.search_edit = None
+        self.show_outdated_check = None
+        self.refresh_button = None
+        self.tray_icon = None
+        self._close_action = None
+        self.packages_model = None
+        self.active_tasks = None
+        # 搜索框和过滤复选框共用一个单次计时器，重复触发只会重新计时，一串输入只过滤一次
+        self._global_filter_timer = QTimer(self)
+        self._global_filter_timer.setSingleShot(True)
+        self._global_filter_timer.timeout.connect(self._run_delayed_filter)
+        self._refresh_pending = False
+        self._hidden_columns = None  # 已应用的列隐藏状态，None表示需要从配置重新读取
+
+        # update_single_package积累的待刷新软件包，由单次计时器统一刷新
+        self._pending_updates = set()
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(50)
+        self._flush_timer.timeout.connect(self._flush_updates)
+
+        # 单个AUR检查结果先暂存，由单次计时器合并成一次批量写入数据库
+        self._pending_aur_versions = {}  # 软件包名称 -> AUR版本
+        self._aur_write_timer = QTimer(self)
+        self._aur_write_timer.setSingleShot(True)
+        self._aur_write_timer.setInterval(50)
+        self._aur_write_timer.timeout.connect(self._flush_aur_writes)
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._flush_aur_writes)
+            # 窗口状态等仅写入内存的配置修改在退出时统一保存一次
+            app.aboutToQuit.connect(self.config.flush)
+
+        # 全选按钮当前是否处于全选状态，避免比较按钮文本
+        self._all_selected = False
+
+        # 过滤结果缓存，软件包数据变化时递增_pkg_cache_epoch使缓存失效
+        self._pkg_cache_epoch = 0
+        self._last_filter_key = None
+        self._last_filter_result = None
+
+        # 软件包名称索引，避免按名称线性查找
+        self._packages_by_name = {}
+        self._filtered_by_name = {}
+
+        # 初始化检查器模块，主检查器由_init_version_services按需创建
         self.aur_checker = AurCheckerModule(logger, db)
+        self.main_checker = None
+        self._services_initialized = False
+        self._package_lookup_cache = {}  # 软件包名称 -> (查询时间, 数据库记录)
 
         # 初始化定时检查模块
         self.scheduler = SchedulerModule(logger, config)
@@ -233,30 +343,40 @@ class MainWindowWrapper(QMainWindow, PackageOperationsMixin, UpdateUIMixin, Syst
 
         # 添加设置标签页
         self.settings_tab = SettingsTab(self.config, self.logger)
+        self.settings_tab.register_scheduler(self.scheduler)
         self.tab_widget.addTab(self.settings_tab, "设置")
 
+        # 设置保存后关闭行为、列对齐方式和列可见性可能变化，清除缓存
+        self.settings_tab.settings_saved.connect(self._invalidate_close_action)
+        self.settings_tab.settings_saved.connect(self._reload_table_alignments)
+        self.settings_tab.settings_saved.connect(self._reload_column_visibility)
+
+    def _reload_table_alignments(self):
+        """重新读取表格列的对齐方式"""
+        if self.packages_model is not None:
+            self.packages_model.reload_alignments()
+
     def init_packages_tab(self):
         """初始化软件包标签页，使用UIInitMixin中的方法"""
         UIInitMixin.init_packages_tab(self)
 
     def init_signals(self):
         """初始化信号连接"""
-        if hasattr(self, "search_edit"):
+        if self.search_edit is not None:
             self.search_edit.textChanged.connect(self.on_search_text_changed)
 
-        if hasattr(self, "show_outdated_check"):
+        if self.show_outdated_check is not None:
             self.show_outdated_check.stateChanged.connect(self.on_outdated_filter_changed)
 
-        if hasattr(self, "refresh_button"):
+        if self.refresh_button is not None:
             self.refresh_button.clicked.connect(self.load_packages)
 
     def on_search_text_changed(self, text):
         """处理搜索框文本变化
 
-        为避免多次触发过滤，使用计时器延迟执行过滤
+        为避免每次按键都触发过滤，使用计时器延迟执行过滤
         """
-        # 忽略空字符串，避免在清空搜索框时触发
-        self._setup_delayed_filter("_search_timer", 500, True)
+        self._setup_delayed_filter(self.SEARCH_FILTER_DELAY_MS)
 
     def on_outdated_filter_changed(self, state):
         """处理'仅显示过时'复选框状态变化
@@ -265,87 +385,76 @@ class MainWindowWrapper(QMainWindow, PackageOperationsMixin, UpdateUIMixin, Syst
         """
         is_checked = bool(state)
         self.logger.debug(f"过滤条件改变: 仅显示过时 = {is_checked}")
-        self._setup_delayed_filter("_filter_timer", 500, True)
+        self._setup_delayed_filter(self.SEARCH_FILTER_DELAY_MS)
 
-    def _setup_delayed_filter(self, timer_name, delay_ms, has_filter):
-        """设置延时过滤器，减少代码重复和多次触发
+    def _setup_delayed_filter(self, delay_ms):
+        """启动（或重新启动）延时过滤计时器
 
-        只保留一个活动的过滤计时器，所有过滤请求合并到这个计时器
+        所有过滤请求合并到同一个计时器，计时期间的新请求只会推迟过滤时间
         """
-        # 如果已有全局过滤计时器，先停止它
-        for timer_attr in ["_search_timer", "_filter_timer", "_global_filter_timer"]:
-            if hasattr(self, timer_attr):
-                try:
-                    getattr(self, timer_attr).stop()
-                    self.logger.debug(f"停止了计时器 {timer_attr}")
-                except Exception:
-                    pass
-
-        # 创建新的全局过滤计时器
-        global_timer = QTimer()
-        global_timer.setSingleShot(True)
-        setattr(self, "_global_filter_timer", global_timer)
-
-        # 设置唯一的过滤函数
-        def do_filter():
-            self.logger.debug("执行计时器触发的过滤")
-            # 禁用所有信号，避免重复触发
-            if hasattr(self, "search_edit"):
-                self.search_edit.blockSignals(True)
-            if hasattr(self, "show_outdated_check"):  
-                self.show_outdated_check.blockSignals(True)
+        self._global_filter_timer.start(delay_ms)
 
-            try:
-                # 执行一次过滤
-                self.filter_packages(update_table=True)
-            finally:
-                # 恢复信号
-                if hasattr(self, "search_edit"):
-                    self.search_edit.blockSignals(False)
-                if hasattr(self, "show_outdated_check"):
-                    self.show_outdated_check.blockSignals(False)
-
-        # 连接函数并启动计时器
-        global_timer.timeout.connect(do_filter)
-        global_timer.start(delay_ms)
-        self.logger.debug(f"设置了新的过滤计时器，延迟 {delay_ms}ms")
+    def _run_delayed_filter(self):
+        """执行计时器触发的过滤"""
+        self.logger.debug("执行计时器触发的过滤")
+        # 禁用所有信号，避免重复触发
+        if self.search_edit is not None:
+            self.search_edit.blockSignals(True)
+        if self.show_outdated_check is not None:
+            self.show_outdated_check.blockSignals(True)
+
+        try:
+            # 执行一次过滤
+            self.filter_packages(update_table=True)
+        finally:
+            # 恢复信号
+            if self.search_edit is not None:
+                self.search_edit.blockSignals(False)
+            if self.show_outdated_check is not None:
+                self.show_outdated_check.blockSignals(False)
 
     def _apply_column_visibility(self):
-        """应用列可见性设置"""
+        """应用列可见性设置
+
+        可见性只在首次调用和设置保存后从配置读取，之后每次刷新表格都直接跳过
+        """
+        if self._hidden_columns is not None:
+            return
+
         ui_config = self.config.get("ui", {})
-        columns = [
-            (1, "show_name", True),               # 名称列
-            (2, "show_aur_version", True),        # AUR版本列
-            (3, "show_upstream_version", True),   # 上游版本列
-            (4, "show_status", False),            # 状态列
-            (5, "show_aur_check_time", True),     # AUR检查时间列
-            (6, "show_upstream_check_time", True),# 上游检查时间列
-            (7, "show_checker_type", True),       # 检查器类型列
-            (8, "show_upstream_url", False),      # 上游URL列
-            (9, "show_notes", False)              # 备注列
-        ]
+        self._hidden_columns = tuple(
+            not bool(ui_config.get(key, default)) for _, key, default in self._COLUMN_VISIBILITY_KEYS
+        )
 
         # 应用所有列的可见性设置
-        for idx, key, default in columns:
-            self.packages_table.setColumnHidden(idx, not bool(ui_config.get(key, default)))
+        for (idx, _, _), hidden in zip(self._COLUMN_VISIBILITY_KEYS, self._hidden_columns):
+            self.packages_table.setColumnHidden(idx, hidden)
+
+    def _reload_column_visibility(self):
+        """设置保存后重新读取并应用列可见性"""
+        self._hidden_columns = None
+        self._apply_column_visibility()
 
     def load_packages(self):
         """异步加载软件包列表"""
         self.logger.info("开始异步加载软件包列表")
 
+        # 添加、编辑和删除软件包后都会重新加载列表，立即丢弃可能已过时的单包查询缓存，
+        # 避免异步加载完成前开始的检查仍使用旧的检查器类型或版本提取键
+        self._package_lookup_cache.clear()
+
         # 显示加载状态
-        if hasattr(self, "loading_progress"):
+        if self.loading_progress is not None:
             self.loading_progress.setVisible(True)
             self.loading_progress.setValue(0)
             self.status_label.setText("正在加载数据...")
 
         # 使用QTimer.singleShot模拟异步加载
-        from PySide6.QtCore import QTimer
-
         def async_load():
             try:
                 # 从数据库获取软件包数据
                 self.packages = self.db.get_all_packages()
+                self._pkg_cache_epoch += 1
 
                 if not self.packages:
                     self.logger.error("数据库返回的包列表为空！")
@@ -354,11 +463,12 @@ class MainWindowWrapper(QMainWindow, PackageOperationsMixin, UpdateUIMixin, Syst
                 self.logger.info(f"从数据库加载了 {len(self.packages)} 个包")
 
                 # 更新加载进度
-                if hasattr(self, "loading_progress"):
+                if self.loading_progress is not None:
                     self.loading_progress.setValue(50)
 
-                # 检查版本信息，确保每个包都有版本字段
+                # 检查版本信息，确保每个包都有版本字段，并缓存小写名称供过滤使用
                 for pkg in self.packages:
+                    pkg["_name_lower"] = pkg.get("name", "").lower()
                     if not pkg.get("aur_version") and not pkg.get("version"):
                         # 如果没有版本信息但有上游版本，使用上游版本作为本地版本
                         if pkg.get("upstream_version"):
@@ -366,23 +476,30 @@ class MainWindowWrapper(QMainWindow, PackageOperationsMixin, UpdateUIMixin, Syst
 
                 # 设置过滤后的包列表
                 self.filtered_packages = self.packages.copy()
+                self._rebuild_package_index()
 
                 # 更新加载进度
-                if hasattr(self, "loading_progress"):
+                if self.loading_progress is not None:
                     self.loading_progress.setValue(80)
 
                 # 更新表格
                 self.update_packages_table()
 
+                # 加载完成后按内容调整一次数据列宽度，单行更新时不再重新计算
+                header = self.packages_table.horizontalHeader()
+                for column in range(1, self.packages_model.columnCount()):
+                    if header.sectionResizeMode(column) == QHeaderView.Interactive:
+                        self.packages_table.resizeColumnToContents(column)
+
                 # 完成加载
-                if hasattr(self, "loading_progress"):
+                if self.loading_progress is not None:
                     self.loading_progress.setValue(100)
                     QTimer.singleShot(500, lambda: self.loading_progress.setVisible(False))
                     self.status_label.setText("就绪")
 
             except Exception as e:
                 self.logger.error(f"加载数据时出错: {str(e)}")
-                if hasattr(self, "loading_progress"):
+                if self.loading_progress is not None:
                     self.loading_progress.setVisible(False)
                 self.status_label.setText(f"加载失败: {str(e)}")
 
@@ -392,37 +509,45 @@ class MainWindowWrapper(QMainWindow, PackageOperationsMixin, UpdateUIMixin, Syst
     def filter_packages(self, update_table=True):
         """根据过滤条件筛选软件包"""
         # 获取搜索框文本和过滤条件
-        search_text = self.search_edit.text().lower() if hasattr(self, "search_edit") else ""
-        show_outdated = self.show_outdated_check.isChecked() if hasattr(self, "show_outdated_check") else False
+        search_text = self.search_edit.text().lower() if self.search_edit is not None else ""
+        show_outdated = self.show_outdated_check.isChecked() if self.show_outdated_check is not None else False
 
         # 记录过滤条件
         self.logger.info(f"应用过滤: 搜索文本='{search_text}', 仅显示过时={show_outdated}")
 
         # 确保packages列表存在
-        if not hasattr(self, "packages") or not self.packages:
+        if not self.packages:
             self.logger.warning("没有可用的软件包列表")
             return
 
-        # 应用过滤逻辑
-        self.filtered_packages = []
-        for pkg in self.packages:
-            name = pkg.get("name", "").lower()
+        # 过滤条件和数据都未变化时直接复用上次结果，表格已是最新状态
+        filter_key = (search_text, show_outdated, self._pkg_cache_epoch)
+        if update_table and filter_key == self._last_filter_key:
+            self.logger.debug("过滤条件未变化，复用上次的过滤结果")
+            if self.filtered_packages is not self._last_filter_result:
+                self.filtered_packages = self._last_filter_result
+                self._rebuild_package_index()
+            return
 
+        # 新的搜索文本是上次的延伸时，只需在上次的结果中继续缩小范围
+        source = self.packages
+        if self._last_filter_key is not None:
+            last_text, last_outdated, last_epoch = self._last_filter_key
+            if (last_epoch == self._pkg_cache_epoch and last_outdated == show_outdated
+                    and search_text.startswith(last_text)):
+                source = self._last_filter_result
+
+        # 应用过滤逻辑，每个条件用一次列表推导完成，名称使用加载时缓存的小写形式
+        filtered = list(source)
+        if search_text:
             # 搜索名称过滤
-            if search_text and search_text not in name:
-                continue
+            filtered = [pkg for pkg in filtered if search_text in pkg["_name_lower"]]
+        if show_outdated:
+            # 过时包过滤：与状态列使用同一个判断，不包括最新、超前和未知的包
+            filtered = [pkg for pkg in filtered if is_outdated(pkg)]
+        self.filtered_packages = filtered
 
-            # 过时包过滤
-            if show_outdated:
-                aur_version = pkg.get("aur_version")
-                upstream_version = pkg.get("upstream_version")
-
-                # 跳过没有两个版本或版本相同的包
-                if not (aur_version and upstream_version and aur_version != upstream_version):
-                    continue
-
-            # 通过所有过滤条件，添加到结果列表
-            self.filtered_packages.append(pkg)
+        self._rebuild_package_index()
 
         # 如果过滤后列表为空但原始列表有数据，给出提示
         if not self.filtered_packages and self.packages:
@@ -431,6 +556,13 @@ class MainWindowWrapper(QMainWindow, PackageOperationsMixin, UpdateUIMixin, Syst
         # 更新表格显示
         if update_table:
             self.update_packages_table()
+            self._last_filter_key = filter_key
+            self._last_filter_result = self.filtered_packages
+
+    def _rebuild_package_index(self):
+        """重建软件包名称到数据的索引"""
+        self._packages_by_name = {p["name"]: p for p in self.packages}
+        self._filtered_by_name = {p["name"]: p for p in self.filtered_packages}
 
     def update_packages_table(self):
         """更新软件包表格的内容"""
@@ -441,21 +573,23 @@ class MainWindowWrapper(QMainWindow, PackageOperationsMixin, UpdateUIMixin, Syst
         if self.packages and not self.filtered_packages:
             self.logger.warning("过滤列表为空但原始列表有数据，重置过滤")
             self.filtered_packages = self.packages.copy()
+            self._rebuild_package_index()
 
-        # 清空表格并重设行数
-        self.packages_table.setRowCount(0)
-        self.packages_table.setRowCount(len(self.filtered_packages))
-
-        # 应用列可见性设置
-        self._apply_column_visibility()
+        # 列可见性调整和模型重置期间暂停重绘，完成后视图只重绘一次
+        self.packages_table.setUpdatesEnabled(False)
+        try:
+            # 应用列可见性设置
+            self._apply_column_visibility()
 
-        # 填充表格数据
-        for row, pkg in enumerate(self.filtered_packages):
-            self._create_table_row(row, pkg)
+            # 模型直接引用过滤后的列表，视图只收到一次重置信号；
+            # 模型在重置内部按当前排序列排好序，不需要视图再次排序
+            self.packages_model.set_packages(self.filtered_packages)
+        finally:
+            self.packages_table.setUpdatesEnabled(True)
 
     def update_package_status(self, row):
         """更新特定行的包状态信息"""
-        TableOperations.update_single_package_status(self, row)
+        self.packages_model.refresh_row(row)
 
     def update_package_after_check(self, package_name):
         """版本检查完成后更新包信息
@@ -468,25 +602,18 @@ class MainWindowWrapper(QMainWindow, PackageOperationsMixin, UpdateUIMixin, Syst
         if not updated_pkg:
             self.logger.warning(f"无法获取包 {package_name} 的最新数据")
             return
+        updated_pkg["_name_lower"] = package_name.lower()
 
-        # 更新内存中的包数据
-        for i, pkg in enumerate(self.packages):
-            if pkg.get("name") == package_name:
-                self.packages[i] = updated_pkg
-                break
-
-        # 更新过滤后的包列表
-        for i, pkg in enumerate(self.filtered_packages):
-            if pkg.get("name") == package_name:
-                self.filtered_packages[i] = updated_pkg
-                break
-
-        # 更新UI表格
-        for row in range(self.packages_table.rowCount()):
-            name_item = self.packages_table.item(row, 1)
-            if name_item and name_item.text() == package_name:
-                self._create_table_row(row, updated_pkg)
-                break
+        # 通过名称索引原地更新内存中的包数据，完整列表、过滤列表和表格模型共享同一个字典，
+        # 不需要逐个扫描列表替换
+        pkg = self._packages_by_name.get(package_name)
+        if pkg is None:
+            return
+        pkg.update(updated_pkg)
+        self._pkg_cache_epoch += 1
+
+        # 更新UI表格，只通知视图重绘该行
+        self.packages_model.refresh_packages((package_name,))
 
     def check_all_packages(self, check_type="aur"):
         """检查所有软件包"""
@@ -505,10 +632,10 @@ class MainWindowWrapper(QMainWindow, PackageOperationsMixin, UpdateUIMixin, Syst
         search_text = ""
         show_outdated = False
 
-        if hasattr(self, "search_edit") and self.search_edit:
+        if self.search_edit is not None:
             search_text = self.search_edit.text()
 
-        if hasattr(self, "show_outdated_check") and self.show_outdated_check:
+        if self.show_outdated_check is not None:
             show_outdated = self.show_outdated_check.isChecked()
 
         self.logger.debug(f"保存当前过滤条件: 搜索文本='{search_text}', 仅显示过时={show_outdated}")
@@ -517,7 +644,7 @@ class MainWindowWrapper(QMainWindow, PackageOperationsMixin, UpdateUIMixin, Syst
         had_search_connection = False
         had_outdated_connection = False
 
-        if hasattr(self, "search_edit") and self.search_edit:
+        if self.search_edit is not None:
             # 临时断开文本变化信号
             try:
                 # 检查信号是否已连接的方法
@@ -531,7 +658,7 @@ class MainWindowWrapper(QMainWindow, PackageOperationsMixin, UpdateUIMixin, Syst
             except Exception as e:
                 self.logger.debug(f"搜索框信号断开时出错: {str(e)}")
 
-        if hasattr(self, "show_outdated_check") and self.show_outdated_check:
+        if self.show_outdated_check is not None:
             # 临时断开复选框状态变化信号
             try:
                 # 检查信号是否已连接的方法
@@ -546,18 +673,16 @@ class MainWindowWrapper(QMainWindow, PackageOperationsMixin, UpdateUIMixin, Syst
                 self.logger.debug(f"过滤复选框信号断开时出错: {str(e)}")
 
         # 清空搜索框和复选框
-        if hasattr(self, "search_edit") and search_text:
+        if self.search_edit is not None and search_text:
             self.search_edit.setText("")
 
-        if hasattr(self, "show_outdated_check") and show_outdated:
+        if self.show_outdated_check is not None and show_outdated:
             self.show_outdated_check.setChecked(False)
 
         # 重新加载所有包
         self.load_packages()
 
         # 使用延时器确保UI更新完成后再应用过滤
-        from PySide6.QtCore import QTimer
-
         def apply_filters():
             self.logger.info(f"开始应用保存的过滤条件: 搜索文本='{search_text}', 仅显示过时={show_outdated}")
 
@@ -565,11 +690,11 @@ class MainWindowWrapper(QMainWindow, PackageOperationsMixin, UpdateUIMixin, Syst
                 # 先手动应用过滤
                 if search_text or show_outdated:
                     # 直接修改搜索框和复选框，此时信号已断开，不会触发过滤
-                    if hasattr(self, "search_edit") and search_text:
+                    if self.search_edit is not None and search_text:
                         self.search_edit.setText(search_text)
                         self.logger.debug(f"已设置搜索框文本: {search_text}")
 
-                    if hasattr(self, "show_outdated_check") and show_outdated:
+                    if self.show_outdated_check is not None and show_outdated:
                         self.show_outdated_check.setChecked(show_outdated)
                         self.logger.debug(f"已设置'仅显示过时': {show_outdated}")
 
@@ -579,24 +704,24 @@ class MainWindowWrapper(QMainWindow, PackageOperationsMixin, UpdateUIMixin, Syst
                     self.filter_packages(update_table=True)
 
                 # 重新连接信号
-                if hasattr(self, "search_edit") and had_search_connection:
+                if self.search_edit is not None and had_search_connection:
                     self.search_edit.textChanged.connect(self.on_search_text_changed)
                     self.logger.debug("已重新连接搜索框信号")
 
-                if hasattr(self, "show_outdated_check") and had_outdated_connection:
+                if self.show_outdated_check is not None and had_outdated_connection:
                     self.show_outdated_check.stateChanged.connect(self.on_outdated_filter_changed)
                     self.logger.debug("已重新连接过滤复选框信号")
 
             except Exception as e:
                 self.logger.error(f"恢复过滤条件时出错: {str(e)}")
                 # 确保信号被重新连接
-                if hasattr(self, "search_edit") and had_search_connection:
+                if self.search_edit is not None and had_search_connection:
                     try:
                         self.search_edit.textChanged.connect(self.on_search_text_changed)
                     except Exception:
                         pass
 
-                if hasattr(self, "show_outdated_check") and had_outdated_connection:
+                if self.show_outdated_check is not None and had_outdated_connection:
                     try:
                         self.show_outdated_check.stateChanged.connect(self.on_outdated_filter_changed)
                     except Exception:
@@ -645,10 +770,10 @@ class MainWindowWrapper(QMainWindow, PackageOperationsMixin, UpdateUIMixin, Syst
         self.save_window_state()
 
         # 获取关闭行为设置
-        close_action = self.config.get("ui", {}).get("close_action", "minimize")
+        close_action = self._get_close_action()
         
         # 如果设置为最小化并且有系统托盘，则最小化到托盘
-        if close_action == "minimize" and hasattr(self, "tray_icon") and self.tray_icon is not None:
+        if close_action == "minimize" and self.tray_icon is not None:
             # 显示通知（如果启用）
             if self.config.get("ui", {}).get("show_minimize_notification", True):
                 self.tray_icon.showMessage(
@@ -666,7 +791,7 @@ class MainWindowWrapper(QMainWindow, PackageOperationsMixin, UpdateUIMixin, Syst
         # 如果不是最小化或没有系统托盘，则正常处理关闭
         
         # 检查是否有活跃任务
-        if hasattr(self, "active_tasks") and self.active_tasks:
+        if self.active_tasks:
             reply = QMessageBox.question(
                 self, "确认退出", "有正在进行的检查任务，确定要退出吗？",
                 QMessageBox.Yes | QMessageBox.No, QMessageBox.No
@@ -675,13 +800,16 @@ class MainWindowWrapper(QMainWindow, PackageOperationsMixin, UpdateUIMixin, Syst
                 event.ignore()
                 return
 
-        # 停止定时检查任务
-        if hasattr(self, "scheduler"):
+        # 停止定时检查任务，不等待正在进行的检查，不阻塞窗口关闭
+        if self.scheduler is not None:
             try:
                 self.logger.info("正在停止定时检查任务...")
                 self.scheduler.stop()
             except Exception as e:
                 self.logger.error(f"停止定时检查任务时出错: {str(e)}")
 
+        # 写入尚未落盘的AUR检查结果
+        self._flush_aur_writes()
+
         # 默认行为
         event.accept()
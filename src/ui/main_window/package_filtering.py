@@ -1,6 +1,4 @@
 # -*- coding: utf-8 -*-
-from PySide6.QtWidgets import QTableWidgetItem
-from PySide6.QtCore import Qt
 
 class PackageFiltering:
     """
@@ -40,41 +38,32 @@ class PackageFiltering:
         show_both = main_window.show_both_checkbox.isChecked()
         show_none = main_window.show_none_checkbox.isChecked()
 
-        # 清空表格
-        main_window.packages_table.setRowCount(0)
-
-        # 填充表格
-        row = 0
+        # 预先计算复选框过滤条件：(有AUR版本, 有上游版本) -> 是否显示
+        # 所有复选框都未勾选时显示全部
+        none_checked = not (show_aur or show_upstream or show_both or show_none)
+        allowed = {
+            (True, False): show_aur or none_checked,
+            (False, True): show_upstream or none_checked,
+            (True, True): show_both or none_checked,
+            (False, False): show_none or none_checked
+        }
+
+        # 单次遍历得到过滤结果，不再逐行insertRow并回查软件包列表
+        filtered = []
         for package in main_window.packages:
-            name = package.get("name", "")
-
             # 应用过滤器
-            if filter_text and filter_text not in name.lower():
+            if filter_text and filter_text not in package.get("name", "").lower():
                 continue
 
+            # 应用复选框过滤条件
             has_aur = package.get("aur_version") is not None
             has_upstream = package.get("upstream_version") is not None
+            if allowed[(has_aur, has_upstream)]:
+                filtered.append(package)
 
-            # 应用复选框过滤条件
-            if (show_aur and has_aur and not has_upstream) or                (show_upstream and not has_aur and has_upstream) or                (show_both and has_aur and has_upstream) or                (show_none and not has_aur and not has_upstream) or                (not show_aur and not show_upstream and not show_both and not show_none):
-
-                # 添加一行
-                main_window.packages_table.insertRow(row)
-
-                # 复选框
-                checkbox = QTableWidgetItem()
-                checkbox.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
-                checkbox.setCheckState(Qt.Unchecked)
-                main_window.packages_table.setItem(row, 0, checkbox)
-
-                # 包名
-                name_item = QTableWidgetItem(name)
-                main_window.packages_table.setItem(row, 1, name_item)
-
-                # 更新行状态
-                main_window.update_package_status(row)
-
-                row += 1
+        # 保存过滤结果，并一次性替换表格模型的数据
+        main_window.filtered_packages = filtered
+        main_window.packages_model.set_packages(filtered)
 
     @staticmethod
     def update_package_status(main_window, row):
@@ -84,46 +73,5 @@ class PackageFiltering:
         Args:
             row: 表格中的行号
         """
-        # 获取包名
-        name_item = main_window.packages_table.item(row, 1)
-        if not name_item:
-            return
-
-        name = name_item.text()
-
-        # 查找包数据
-        package = None
-        for p in main_window.packages:
-            if p.get("name") == name:
-                package = p
-                break
-
-        if not package:
-            return
-
-        # 本地版本
-        local_version = package.get("local_version", "")
-        local_item = QTableWidgetItem(local_version)
-        main_window.packages_table.setItem(row, 2, local_item)
-
-        # AUR版本
-        aur_version = package.get("aur_version", "")
-        aur_item = QTableWidgetItem(aur_version)
-        main_window.packages_table.setItem(row, 3, aur_item)
-
-        # 上游版本
-        upstream_version = package.get("upstream_version", "")
-        upstream_item = QTableWidgetItem(upstream_version)
-        main_window.packages_table.setItem(row, 4, upstream_item)
-
-        # 上次检查时间
-        last_check = package.get("last_check", "")
-        if last_check:
-            try:
-                # 格式化为易读的日期时间
-                last_check_item = QTableWidgetItem(last_check)
-            except ValueError:
-                last_check_item = QTableWidgetItem(str(last_check))
-        else:
-            last_check_item = QTableWidgetItem("")
-        main_window.packages_table.setItem(row, 5, last_check_item)
+        # 行数据直接来自模型，只需通知视图重绘该行
+        main_window.packages_model.refresh_row(row)
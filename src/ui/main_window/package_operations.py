@@ -2,30 +2,32 @@
 """
 软件包操作相关功能模块
 """
-from PySide6.QtWidgets import QTableWidgetItem, QMessageBox, QMenu, QApplication
+from PySide6.QtWidgets import QMessageBox, QMenu, QApplication
 from PySide6.QtGui import QAction
 from PySide6.QtCore import Qt
 from .package_dialog import PackageDialog
 
+# 复选框状态常量
+_CHECKED = Qt.Checked
+_UNCHECKED = Qt.Unchecked
+
+# 回退路径从表格行重建包信息时读取的字段及对应列
+_FALLBACK_COLUMNS = (("aur_version", 2), ("upstream_version", 3), ("status", 4), ("upstream_url", 8))
+
 class PackageOperationsMixin:
     """软件包操作相关的方法混入类"""
     
-    def copy_cell_content(self, row, column):
+    def copy_cell_content(self, index):
         """复制单元格内容到剪贴板
         
         Args:
-            row: 行索引
-            column: 列索引
+            index: 被双击单元格的模型索引
         """
-        if row < 0 or column < 0:
+        if not index.isValid():
             return
             
         # 获取单元格内容
-        item = self.packages_table.item(row, column)
-        if not item:
-            return
-            
-        content = item.text()
+        content = self.packages_model.text(index.row(), index.column())
         if not content:
             return
             
@@ -45,253 +47,160 @@ class PackageOperationsMixin:
         Returns:
             list: 选中的软件包列表
         """
-        self.logger.debug("==== 开始获取选中的软件包 ====")
+        # 调试日志未启用时跳过所有调试信息的格式化
+        debug_enabled = self.logger.is_enabled_for("DEBUG")
+        if debug_enabled:
+            self.logger.debug("==== 开始获取选中的软件包 ====")
+            self.logger.debug(f"表格大小: {self.packages_model.rowCount()} 行 x {self.packages_model.columnCount()} 列")
         selected_packages = []
         selected_rows = set()
 
-        # 记录表格基本信息
-        table_rows = self.packages_table.rowCount()
-        table_cols = self.packages_table.columnCount()
-        self.logger.debug(f"表格大小: {table_rows} 行 x {table_cols} 列")
-
-        # 检查选择模式
-        selection_mode = self.packages_table.selectionMode()
-        selection_behavior = self.packages_table.selectionBehavior()
-        self.logger.debug(f"表格选择模式: mode={selection_mode}, behavior={selection_behavior}")
-
         # 1. 首先获取通过鼠标选中的行
-        # 方法一: 通过selectedIndexes()
-        selected_indexes = self.packages_table.selectedIndexes()
-
-        # 记录鼠标选择的详细情况
-        if selected_indexes:
-            self.logger.debug(f"鼠标选中了 {len(selected_indexes)} 个单元格")
-            index_rows = []
-            for index in selected_indexes:
-                row = index.row()
-                col = index.column()
-                selected_rows.add(row)
-                index_rows.append(f"({row},{col})")
-            self.logger.debug(f"选中的单元格位置: {', '.join(index_rows)}")
-
-        # 方法二: 通过selectedItems()（更直接的方法）
-        selected_items = self.packages_table.selectedItems()
-        if selected_items:
-            self.logger.debug(f"通过selectedItems()检测到 {len(selected_items)} 个选中项目")
-            item_details = []
-            for item in selected_items:
-                row = item.row()
-                col = item.column()
-                text = item.text() if hasattr(item, 'text') else "无文本"
-                selected_rows.add(row)
-                item_details.append(f"({row},{col})={text}")
-            self.logger.debug(f"选中项目详情: {', '.join(item_details[:5])}{'...' if len(item_details) > 5 else ''}")
-
-        # 方法三: 通过selectedRanges()
-        selected_ranges = self.packages_table.selectedRanges()
-        if selected_ranges:
-            self.logger.debug(f"检测到 {len(selected_ranges)} 个选中范围")
-            for i, range_item in enumerate(selected_ranges):
-                top = range_item.topRow()
-                bottom = range_item.bottomRow()
-                left = range_item.leftColumn()
-                right = range_item.rightColumn()
-                self.logger.debug(f"范围 {i+1}: 从 ({top},{left}) 到 ({bottom},{right}), 共 {bottom-top+1} 行")
-                for row in range(top, bottom + 1):
-                    selected_rows.add(row)
-
-        if selected_rows:
-            self.logger.debug(f"鼠标选择的行（所有方法合并）: {sorted(list(selected_rows))}")
-        else:
-            self.logger.warning("通过所有方法都未检测到鼠标选中的行")
+        # 按选中范围整段取行，不逐个枚举选中单元格的索引
+        selected_ranges = self.packages_table.selectionModel().selection()
+        for range_item in selected_ranges:
+            selected_rows.update(range(range_item.top(), range_item.bottom() + 1))
+
+        if debug_enabled:
+            self.logger.debug(f"鼠标选择了 {len(selected_ranges)} 个范围，共 {len(selected_rows)} 行")
 
         # 2. 然后获取通过复选框选中的行
-        checkbox_selected = 0
-        for row in range(self.packages_table.rowCount()):
-            checkbox_item = self.packages_table.item(row, 0)
-            if checkbox_item and checkbox_item.checkState() == Qt.Checked:
-                selected_rows.add(row)
-                checkbox_selected += 1
-
-        if checkbox_selected:
-            self.logger.debug(f"通过复选框选中了 {checkbox_selected} 行")
-
-        # 记录总选中行数
-        self.logger.debug(f"总共选中了 {len(selected_rows)} 行")
-
-        # 检查filtered_packages是否可用
-        if hasattr(self, 'filtered_packages'):
-            self.logger.debug(f"filtered_packages可用，包含 {len(self.filtered_packages)} 个包")
-            # 输出前几个包的名称以验证数据
-            if self.filtered_packages:
-                sample_names = [p.get('name', 'unknown') for p in self.filtered_packages[:3]]
-                self.logger.debug(f"filtered_packages样本: {sample_names}...")
-        else:
-            self.logger.warning("filtered_packages不可用！")
+        checked_rows = self.packages_model.checked_rows()
+        selected_rows.update(checked_rows)
 
-        # 3. 处理所有选中的行
-        self.logger.debug(f"开始处理 {len(selected_rows)} 个选中的行...")
-        row_processed = 0
+        if debug_enabled:
+            self.logger.debug(f"通过复选框选中了 {len(checked_rows)} 行，总共选中了 {len(selected_rows)} 行")
 
+        # 3. 处理所有选中的行，通过名称索引查找完整的软件包信息
         for row in selected_rows:
-            row_processed += 1
             # 获取软件包名称
-            name_item = self.packages_table.item(row, 1)
-
-            if name_item:
-                package_name = name_item.text()
-                self.logger.debug(f"处理行 {row} (第{row_processed}/{len(selected_rows)}行): 包名={package_name}")
-
-                # 从当前显示的软件包列表中查找完整信息
-                package_found = False
-
-                # 检查filtered_packages是否为列表且有元素
-                if hasattr(self, 'filtered_packages') and isinstance(self.filtered_packages, list) and self.filtered_packages:
-                    self.logger.debug(f"开始在 {len(self.filtered_packages)} 个filtered_packages中查找 {package_name}")
-
-                    for package in self.filtered_packages:
-                        if isinstance(package, dict) and package.get("name") == package_name:
-                            selected_packages.append(package)
-                            package_found = True
-                            self.logger.debug(f"在filtered_packages中找到 {package_name}, 包含键: {list(package.keys())}")
-                            break
-
-                    if not package_found:
-                        self.logger.warning(f"在filtered_packages中找不到名为 {package_name} 的软件包")
-                else:
-                    self.logger.warning(f"filtered_packages不可用或为空，无法查找 {package_name}")
-            else:
+            package_name = self.packages_model.text(row, 1)
+            if not package_name:
                 self.logger.warning(f"行 {row} 的名称单元格为空")
+                continue
 
-        self.logger.debug(f"完成处理，最终找到 {len(selected_packages)} 个软件包信息")
-
-        # 如果没有找到包，记录一个明确的警告
-        if not selected_packages and selected_rows:
-            self.logger.warning(f"虽然选中了 {len(selected_rows)} 行，但未能获取任何软件包信息！")
-
-        # 如果没有选中的包但有选中的行，可能是表格选择问题
-        if len(selected_packages) == 0 and len(selected_rows) > 0:
-            self.logger.warning("有选中的行但未找到对应的软件包信息，尝试直接使用表格数据")
-
-            # 直接从表格获取数据
-            for row in selected_rows:
-                name_item = self.packages_table.item(row, 1)
-                if name_item:
-                    package_name = name_item.text()
-                    self.logger.info(f"正在处理选中行的包名: {package_name}")
-
-                    # 尝试直接从所有包中查找
-                    package_found = False
-
-                    # 如果self.packages可用
-                    if hasattr(self, 'packages'):
-                        for package in self.packages:
-                            if package["name"] == package_name:
-                                selected_packages.append(package)
-                                package_found = True
-                                self.logger.info(f"在完整包列表中找到了: {package_name}")
-                                break
-                    else:
-                        self.logger.warning("self.packages不可用，跳过完整包列表搜索")
-
-                    # 无论如何，确保从表格创建一个可用的包对象
-                    # 不依赖于在包列表中找到
-                    # 创建包对象
-
-                    # 创建一个基本的包信息
-                    basic_package = {"name": package_name}
-
-                    # 尝试获取AUR版本
-                    aur_item = self.packages_table.item(row, 2)
-                    if aur_item and aur_item.text():
-                        basic_package["aur_version"] = aur_item.text()
-                        self.logger.debug(f"添加AUR版本: {aur_item.text()}")
-
-                    # 尝试获取上游版本
-                    upstream_item = self.packages_table.item(row, 3)
-                    if upstream_item and upstream_item.text():
-                        basic_package["upstream_version"] = upstream_item.text()
-                        self.logger.debug(f"添加上游版本: {upstream_item.text()}")
-
-                    # 尝试获取状态
-                    status_item = self.packages_table.item(row, 4)
-                    if status_item and status_item.text():
-                        basic_package["status"] = status_item.text()
-
-                    # 尝试获取上游URL
-                    try:
-                        upstream_url_item = self.packages_table.item(row, 8)
-                        if upstream_url_item and upstream_url_item.text():
-                            basic_package["upstream_url"] = upstream_url_item.text()
-                            self.logger.debug(f"添加上游URL: {upstream_url_item.text()}")
-                    except Exception as e:
-                        self.logger.warning(f"获取上游URL时出错: {e}")
-
-                    # 添加到选中包列表
-                    selected_packages.append(basic_package)
-                    self.logger.info(f"直接从表格添加了软件包: {package_name}, 包含字段: {list(basic_package.keys())}")
+            # 先在当前显示的软件包中查找，再回退到完整包列表
+            package = self._filtered_by_name.get(package_name) or self._packages_by_name.get(package_name)
+            if package is not None:
+                selected_packages.append(package)
+                continue
+
+            # 索引中找不到时，直接从表格数据创建一个基本的包信息
+            self.logger.warning(f"找不到名为 {package_name} 的软件包，尝试直接使用表格数据")
+            basic_package = self._row_to_package_dict(row)
+            selected_packages.append(basic_package)
+            self.logger.info(f"直接从表格添加了软件包: {package_name}, 包含字段: {list(basic_package.keys())}")
+
+        if debug_enabled:
+            self.logger.debug(f"完成处理，最终找到 {len(selected_packages)} 个软件包信息")
 
         return selected_packages
 
-    def show_package_context_menu(self, position):
-        """显示软件包的上下文菜单
+    def _row_to_package_dict(self, row):
+        """根据表格行显示的内容创建一个基本的包信息
 
         Args:
-            position: 菜单位置
+            row: 行索引
+
+        Returns:
+            dict: 只包含表格中非空字段的包信息
         """
-        menu = QMenu()
+        # 模型本身就是按行对齐的数据存储，取一次行数据后直接计算各列文本
+        pkg = self.packages_model.package_at(row) or {}
+        cell_text = self.packages_model.cell_text
+        basic_package = {"name": cell_text(pkg, 1)}
 
-        # 获取当前选中的行
-        row = self.packages_table.rowAt(position.y())
-        if row < 0:
-            return
+        # AUR版本、上游版本、状态和上游URL
+        for key, column in _FALLBACK_COLUMNS:
+            text = cell_text(pkg, column)
+            if text:
+                basic_package[key] = text
 
-        # 获取软件包名称
-        package_name = self.packages_table.item(row, 1).text()
+        return basic_package
 
-        # 查找完整的软件包信息
-        package = None
-        for p in self.filtered_packages:
-            if p["name"] == package_name:
-                package = p
-                break
+    def _init_package_context_menu(self):
+        """创建可复用的软件包右键菜单
 
-        if not package:
-            return
+        菜单和菜单项只创建一次，菜单项的槽函数从self._ctx_target_package读取当前操作的软件包
+        """
+        self._ctx_target_package = None
+        self._ctx_menu = QMenu(self)
 
         # 编辑菜单项
         edit_action = QAction("编辑", self)
-        edit_action.triggered.connect(lambda: self.edit_package(package))
-        menu.addAction(edit_action)
+        edit_action.triggered.connect(self._ctx_edit_package)
+        self._ctx_menu.addAction(edit_action)
 
         # 删除菜单项
         delete_action = QAction("删除", self)
-        delete_action.triggered.connect(lambda: self.delete_package(package))
-        menu.addAction(delete_action)
+        delete_action.triggered.connect(self._ctx_delete_package)
+        self._ctx_menu.addAction(delete_action)
 
         # 检查AUR菜单项
         check_aur_action = QAction("检查AUR版本", self)
-        check_aur_action.triggered.connect(lambda: self.check_aur_version(package["name"]))
-        menu.addAction(check_aur_action)
-
-        # 检查上游菜单项
-        if package.get("upstream_url"):
-            check_upstream_action = QAction("检查上游版本", self)
-            check_upstream_action.triggered.connect(lambda: self.check_package_version(
-                name=package["name"], 
-                upstream_url=package["upstream_url"],
-                version_extract_key=package.get("version_extract_key")
-            ))
-            menu.addAction(check_upstream_action)
-
-            # 添加检查所有版本菜单项
-            menu.addSeparator()  # 添加分隔线，使菜单更清晰
-            check_all_versions_action = QAction("检查所有版本", self)
-            check_all_versions_action.triggered.connect(lambda: self.check_package_all_versions(package))
-            menu.addAction(check_all_versions_action)
+        check_aur_action.triggered.connect(self._ctx_check_aur_version)
+        self._ctx_menu.addAction(check_aur_action)
+
+        # 检查上游菜单项，只在软件包有上游URL时显示
+        self._ctx_check_upstream_action = QAction("检查上游版本", self)
+        self._ctx_check_upstream_action.triggered.connect(self._ctx_check_upstream_version)
+        self._ctx_menu.addAction(self._ctx_check_upstream_action)
+
+        # 添加检查所有版本菜单项
+        self._ctx_separator = self._ctx_menu.addSeparator()  # 添加分隔线，使菜单更清晰
+        self._ctx_check_all_versions_action = QAction("检查所有版本", self)
+        self._ctx_check_all_versions_action.triggered.connect(self._ctx_check_all_versions)
+        self._ctx_menu.addAction(self._ctx_check_all_versions_action)
+
+    def show_package_context_menu(self, position):
+        """显示软件包的上下文菜单
+
+        Args:
+            position: 菜单位置
+        """
+        # 获取鼠标位置对应的行
+        row = self.packages_table.indexAt(position).row()
+        if row < 0:
+            return
+
+        # 通过名称索引查找完整的软件包信息，找不到时直接使用该行显示的数据
+        package_name = self.packages_model.text(row, 1)
+        package = self._filtered_by_name.get(package_name) or self._row_to_package_dict(row)
+        self._ctx_target_package = package
+
+        # 上游相关菜单项只在有上游URL时显示
+        has_upstream = bool(package.get("upstream_url"))
+        self._ctx_check_upstream_action.setVisible(has_upstream)
+        self._ctx_separator.setVisible(has_upstream)
+        self._ctx_check_all_versions_action.setVisible(has_upstream)
 
         # 显示菜单
-        menu.exec_(self.packages_table.viewport().mapToGlobal(position))
+        self._ctx_menu.exec_(self.packages_table.viewport().mapToGlobal(position))
+
+    def _ctx_edit_package(self):
+        """右键菜单：编辑当前软件包"""
+        self.edit_package(self._ctx_target_package)
+
+    def _ctx_delete_package(self):
+        """右键菜单：删除当前软件包"""
+        self.delete_package(self._ctx_target_package)
+
+    def _ctx_check_aur_version(self):
+        """右键菜单：检查当前软件包的AUR版本"""
+        self.check_aur_version(self._ctx_target_package["name"])
+
+    def _ctx_check_upstream_version(self):
+        """右键菜单：检查当前软件包的上游版本"""
+        package = self._ctx_target_package
+        self.check_package_version(
+            name=package["name"],
+            upstream_url=package["upstream_url"],
+            version_extract_key=package.get("version_extract_key")
+        )
+
+    def _ctx_check_all_versions(self):
+        """右键菜单：检查当前软件包的所有版本"""
+        self.check_package_all_versions(self._ctx_target_package)
 
     def edit_package(self, package):
         """编辑软件包
@@ -346,23 +255,8 @@ class PackageOperationsMixin:
         Args:
             package_name: 要更新的软件包名称
         """
-        # 查找软件包在表格中的行
-        for row in range(self.packages_table.rowCount()):
-            name_item = self.packages_table.item(row, 1)
-            if name_item and name_item.text() == package_name:
-                # 从数据库获取最新数据
-                package_info = self.db.get_package_by_name(package_name)
-                if package_info:
-                    # 更新检查器类型列（假设第6列是检查器类型）
-                    checker_item = self.packages_table.item(row, 5)
-                    if checker_item:
-                        checker_item.setText(package_info.get("checker_type", ""))
-                    
-                    # 更新上游版本检查状态（假设第7列是检查状态）
-                    status_item = self.packages_table.item(row, 6)
-                    if status_item:
-                        status_item.setText("已更新")
-                break
+        # 从数据库获取最新数据，同步内存中的软件包列表和表格中对应的行
+        self.update_package_after_check(package_name)
 
     def add_package(self):
         """添加新软件包"""
@@ -425,16 +319,16 @@ class PackageOperationsMixin:
             return
 
         # 如果没有通过复选框选中的软件包，检查当前选中的行
-        current_row = self.packages_table.currentRow()
+        current_row = self.packages_table.currentIndex().row()
         if current_row >= 0:
             # 获取软件包名称
-            package_name = self.packages_table.item(current_row, 1).text()
+            package_name = self.packages_model.text(current_row, 1)
 
             # 查找完整的软件包信息
-            for package in self.filtered_packages:
-                if package["name"] == package_name:
-                    self.edit_package(package)
-                    return
+            package = self._filtered_by_name.get(package_name)
+            if package is not None:
+                self.edit_package(package)
+                return
 
         # 如果没有选中任何软件包
         QMessageBox.warning(self, "警告", "请先选择一个软件包")
@@ -445,25 +339,24 @@ class PackageOperationsMixin:
         Args:
             state: 复选框状态
         """
-        for row in range(self.packages_table.rowCount()):
-            checkbox_item = self.packages_table.item(row, 0)
-            if checkbox_item:
-                checkbox_item.setCheckState(Qt.Checked if state == Qt.Checked else Qt.Unchecked)
+        self.packages_model.set_all_checked(state == _CHECKED)
 
     def toggle_select_all_button(self):
         """切换全选/取消全选状态
 
-        根据当前按钮文本判断执行全选还是取消全选操作，
+        根据当前全选状态标志执行全选或取消全选操作，
         并更新按钮文本以便下次点击执行相反操作
         """
-        if self.select_all_toggle_button.text() == "全选":
+        if not self._all_selected:
             # 执行全选操作
-            self.toggle_select_all(Qt.Checked)
+            self.toggle_select_all(_CHECKED)
+            self._all_selected = True
             # 更新按钮文本为"取消全选"
             self.select_all_toggle_button.setText("取消全选")
         else:
             # 执行取消全选操作
-            self.toggle_select_all(Qt.Unchecked)
+            self.toggle_select_all(_UNCHECKED)
+            self._all_selected = False
             # 更新按钮文本为"全选"
             self.select_all_toggle_button.setText("全选")
 
@@ -474,7 +367,8 @@ class PackageOperationsMixin:
         """
         self.logger.info("自动选择所有软件包")
         # 使用现有的toggle_select_all方法选中所有软件包
-        self.toggle_select_all(Qt.Checked)
+        self.toggle_select_all(_CHECKED)
+        self._all_selected = True
         # 更新UI中的按钮状态，如果存在
         if hasattr(self, 'select_all_toggle_button'):
             self.select_all_toggle_button.setText("取消全选")
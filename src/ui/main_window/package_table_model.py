@@ -0,0 +1,440 @@
+# -*- coding: utf-8 -*-
+"""
+软件包表格数据模型模块
+"""
+from functools import lru_cache
+
+from packaging.version import InvalidVersion, Version
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QColor
+
+# 对齐配置值到Qt对齐标志的映射，未知值按左对齐处理
+_ALIGN_MAP = {
+    "left": Qt.AlignLeft | Qt.AlignVCenter,
+    "center": Qt.AlignCenter,
+    "right": Qt.AlignRight | Qt.AlignVCenter
+}
+
+# 状态列背景色
+_COLOR_LATEST = QColor(0xC8, 0xE6, 0xC9)    # 绿色背景
+_COLOR_OUTDATED = QColor(0xFF, 0xCD, 0xD2)  # 红色背景
+_COLOR_AHEAD = QColor(0xBB, 0xDE, 0xFB)     # 蓝色背景
+_COLOR_UNKNOWN = QColor(0xE0, 0xE0, 0xE0)   # 灰色背景
+
+
+@lru_cache(maxsize=8192)
+def _parse_version(version_text):
+    """解析版本号，结果按字符串缓存，绘制和排序时反复比较同一批版本不再重复解析
+
+    Args:
+        version_text: 版本号文本
+
+    Returns:
+        Version: 解析结果，无法解析时返回None
+    """
+    try:
+        return Version(version_text)
+    except InvalidVersion:
+        return None
+
+
+def _iso_date(timestamp):
+    """截取ISO格式时间中的日期部分
+
+    用find定位分隔符再切片，不像split那样为每个单元格创建临时列表
+
+    Args:
+        timestamp: ISO格式时间文本
+
+    Returns:
+        str: 日期部分，没有时间部分时原样返回
+    """
+    separator = timestamp.find("T")
+    return timestamp[:separator] if separator >= 0 else timestamp
+
+
+def _package_status(pkg):
+    """根据AUR版本和上游版本计算状态文本
+
+    Args:
+        pkg: 软件包数据
+
+    Returns:
+        str: 状态文本
+    """
+    aur_version = pkg.get("aur_version") or pkg.get("version", "")
+    upstream_version = pkg.get("upstream_version", "")
+    if not aur_version or not upstream_version:
+        return "未知"
+    if aur_version == upstream_version:
+        return "最新"
+
+    # 两个版本都符合PEP 440时按版本语义比较，否则退回字符串比较
+    aur_parsed = _parse_version(aur_version)
+    upstream_parsed = _parse_version(upstream_version)
+    if aur_parsed is not None and upstream_parsed is not None:
+        if aur_parsed == upstream_parsed:
+            return "最新"
+        return "过时" if aur_parsed < upstream_parsed else "超前"
+    if aur_version < upstream_version:
+        return "过时"
+    return "超前"
+
+
+def is_outdated(pkg):
+    """判断软件包是否过时，与状态列使用同一套版本比较规则
+
+    Args:
+        pkg: 软件包数据
+
+    Returns:
+        bool: AUR版本落后于上游版本时返回True
+    """
+    return _package_status(pkg) == "过时"
+
+
+# 各列显示文本的取值函数，按列索引排列；排序时直接作为key使用，
+# 数据库中的NULL字段统一取空字符串，保证排序时各行的key都可以比较，
+# 每一列只查一次取值函数，不再为每个单元格走一遍按列号判断的分支
+_CELL_TEXT_GETTERS = (
+    lambda pkg: "",                                                 # 复选框列
+    lambda pkg: pkg.get("name") or "",                              # 名称
+    lambda pkg: pkg.get("aur_version") or pkg.get("version") or "", # AUR版本，兼容旧的version键
+    lambda pkg: pkg.get("upstream_version") or "",                  # 上游版本
+    _package_status,                                                # 状态
+    # 检查时间只显示年月日，假设时间是ISO格式，如2025-07-24T06:18:29
+    lambda pkg: _iso_date(pkg.get("aur_update_date") or ""),        # AUR检查时间
+    lambda pkg: _iso_date(pkg.get("upstream_update_date") or ""),   # 上游检查时间
+    lambda pkg: pkg.get("checker_type") or "",                      # 检查器类型
+    lambda pkg: pkg.get("upstream_url") or "",                      # 上游URL
+    lambda pkg: pkg.get("notes") or ""                              # 备注
+)
+
+
+class PackageTableModel(QAbstractTableModel):
+    """软件包表格模型
+
+    直接以软件包字典列表作为数据源，视图只按需读取可见单元格，
+    不再为每个单元格创建QTableWidgetItem。
+    """
+
+    # 表头，列顺序与列可见性设置保持一致
+    HEADERS = [
+        "", "名称", "AUR版本", "上游版本", "状态", "AUR检查时间", "上游检查时间",
+        "检查器类型", "上游URL", "备注"
+    ]
+
+    # 各列对应的对齐配置键（ui.text_alignment.<key>）及默认对齐方式
+    ALIGNMENT_KEYS = [
+        (None, "center"),
+        ("name", "left"),
+        ("aur_version", "left"),
+        ("upstream_version", "left"),
+        ("status", "center"),
+        ("aur_check_time", "left"),
+        ("upstream_check_time", "left"),
+        ("checker_type", "left"),
+        ("upstream_url", "left"),
+        ("notes", "left")
+    ]
+
+    # 状态列背景色，使用模块级的QColor常量，绘制时不再逐个单元格解析颜色字符串
+    STATUS_COLORS = {
+        "最新": _COLOR_LATEST,
+        "过时": _COLOR_OUTDATED,
+        "超前": _COLOR_AHEAD,
+        "未知": _COLOR_UNKNOWN
+    }
+
+    # 单元格标志，视图绘制时频繁查询，预先组合好避免每次重复计算
+    CHECK_FLAGS = Qt.ItemIsUserCheckable | Qt.ItemIsEnabled
+    CELL_FLAGS = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+
+    # 软件包数据更新后需要重新读取的角色
+    DATA_ROLES = [Qt.DisplayRole, Qt.BackgroundRole]
+
+    # 每次向视图公开的行数，滚动到底部时由视图通过fetchMore继续加载
+    PAGE_SIZE = 200
+
+    def __init__(self, config, parent=None):
+        """初始化表格模型
+
+        对齐方式在创建时读取一次，设置变化后通过reload_alignments刷新
+
+        Args:
+            config: 配置对象，用于读取列对齐方式
+            parent: 父对象
+        """
+        super().__init__(parent)
+        self.config = config
+        self._rows = []
+        self._loaded = 0  # 已向视图公开的行数
+        self._checked_rows = set()
+        self._row_by_name = {}
+        self._alignments = []
+        self._sort_column = -1
+        self._sort_order = Qt.AscendingOrder
+        self._load_alignments()
+
+    def _load_alignments(self):
+        """从配置读取每列的对齐方式"""
+        text_alignment = self.config.get("ui", {}).get("text_alignment", {}) if self.config else {}
+        self._alignments = [
+            _ALIGN_MAP.get(text_alignment.get(key, default) if key else default, _ALIGN_MAP["left"])
+            for key, default in self.ALIGNMENT_KEYS
+        ]
+
+    def reload_alignments(self):
+        """设置保存后重新读取对齐方式，并通知视图重绘所有单元格"""
+        self._load_alignments()
+        if self._loaded:
+            self.dataChanged.emit(
+                self.index(0, 0), self.index(self._loaded - 1, len(self.HEADERS) - 1),
+                [Qt.TextAlignmentRole]
+            )
+
+    @staticmethod
+    def get_status(pkg):
+        """根据AUR版本和上游版本计算状态文本
+
+        Args:
+            pkg: 软件包数据
+
+        Returns:
+            str: 状态文本
+        """
+        return _package_status(pkg)
+
+    @classmethod
+    def cell_text(cls, pkg, column):
+        """获取软件包在指定列显示的文本
+
+        Args:
+            pkg: 软件包数据
+            column: 列索引
+
+        Returns:
+            str: 显示文本
+        """
+        if 0 <= column < len(_CELL_TEXT_GETTERS):
+            return _CELL_TEXT_GETTERS[column](pkg)
+        return ""
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._loaded < len(self._rows)
+
+    def fetchMore(self, parent=QModelIndex()):
+        """视图滚动到已加载行的末尾时追加下一页"""
+        if parent.isValid():
+            return
+        step = min(self.PAGE_SIZE, len(self._rows) - self._loaded)
+        if step <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + step - 1)
+        self._loaded += step
+        self.endInsertRows()
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and 0 <= section < len(self.HEADERS):
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        # 复选框列只保留必要的标志
+        return self.CHECK_FLAGS if index.column() == 0 else self.CELL_FLAGS
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = index.row()
+        column = index.column()
+        if row >= self._loaded:
+            return None
+
+        if column == 0:
+            if role == Qt.CheckStateRole:
+                return Qt.Checked if row in self._checked_rows else Qt.Unchecked
+            return None
+
+        if role == Qt.DisplayRole:
+            return _CELL_TEXT_GETTERS[column](self._rows[row])
+        if role == Qt.TextAlignmentRole:
+            return self._alignments[column]
+        if role == Qt.BackgroundRole and column == 4:
+            return self.STATUS_COLORS[_package_status(self._rows[row])]
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or index.column() != 0 or role != Qt.CheckStateRole:
+            return False
+
+        row = index.row()
+        if Qt.CheckState(value) == Qt.Checked:
+            self._checked_rows.add(row)
+        else:
+            self._checked_rows.discard(row)
+        self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        return True
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        """按列排序，视图启用排序后由表头点击触发"""
+        self._sort_column = column
+        self._sort_order = order
+
+        # 复选框列不排序
+        if column <= 0 or not self._rows:
+            return
+
+        self.layoutAboutToBeChanged.emit()
+        old_rows = list(self._rows)
+        self._sort_rows()
+
+        # 让选中状态和持久索引跟随软件包移动，移到未加载范围的持久索引失效
+        new_positions = {id(pkg): row for row, pkg in enumerate(self._rows)}
+        self._checked_rows = {new_positions[id(old_rows[row])] for row in self._checked_rows}
+        old_indexes = self.persistentIndexList()
+        new_indexes = []
+        for index in old_indexes:
+            new_row = new_positions[id(old_rows[index.row()])]
+            new_indexes.append(self.index(new_row, index.column()) if new_row < self._loaded else QModelIndex())
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self._rebuild_row_index()
+        self.layoutChanged.emit()
+
+    def _sort_rows(self):
+        """按当前排序设置原地排序数据"""
+        if self._sort_column <= 0:
+            return
+        self._rows.sort(
+            key=_CELL_TEXT_GETTERS[self._sort_column],
+            reverse=self._sort_order == Qt.DescendingOrder
+        )
+
+    def _rebuild_row_index(self):
+        """重建软件包名称到行号的索引，数据替换或重新排序后调用"""
+        self._row_by_name = {pkg.get("name"): row for row, pkg in enumerate(self._rows)}
+
+    def set_packages(self, packages):
+        """替换模型数据，视图只收到一次重置信号
+
+        Args:
+            packages: 软件包列表，模型直接引用该列表
+        """
+        self.beginResetModel()
+        self._rows = packages
+        self._loaded = min(self.PAGE_SIZE, len(packages))
+        self._checked_rows = set()
+        self._sort_rows()
+        self._rebuild_row_index()
+        self.endResetModel()
+
+    def package_at(self, row):
+        """获取指定行的软件包数据
+
+        Args:
+            row: 行索引
+
+        Returns:
+            dict: 软件包数据，行号无效时返回None
+        """
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+    def text(self, row, column):
+        """获取指定单元格显示的文本"""
+        pkg = self.package_at(row)
+        return self.cell_text(pkg, column) if pkg else ""
+
+    def row_of(self, package_name):
+        """查找软件包所在的行
+
+        Args:
+            package_name: 软件包名称
+
+        Returns:
+            int: 行索引，未找到时返回-1
+        """
+        return self._row_by_name.get(package_name, -1)
+
+    def refresh_row(self, row):
+        """通知视图重绘指定行
+
+        复选框列和对齐方式不随软件包数据变化，只通知数据列的显示文本和背景色；
+        尚未加载到视图的行不需要通知
+        """
+        if 0 <= row < self._loaded:
+            self.dataChanged.emit(
+                self.index(row, 1), self.index(row, len(self.HEADERS) - 1), self.DATA_ROLES
+            )
+
+    def refresh_packages(self, names, first_column=1, last_column=None):
+        """通知视图重绘一组软件包所在的行
+
+        通过名称索引定位行，并用一个覆盖受影响行范围的dataChanged信号通知视图
+
+        Args:
+            names: 软件包名称集合
+            first_column: 受影响的第一列，默认从名称列开始
+            last_column: 受影响的最后一列，默认到最后一列
+        """
+        rows = [
+            self._row_by_name[name] for name in names
+            if self._row_by_name.get(name, self._loaded) < self._loaded
+        ]
+        if rows:
+            self.dataChanged.emit(
+                self.index(min(rows), first_column),
+                self.index(max(rows), len(self.HEADERS) - 1 if last_column is None else last_column),
+                self.DATA_ROLES
+            )
+
+    def update_package(self, package):
+        """用新数据替换同名软件包并刷新所在行
+
+        Args:
+            package: 新的软件包数据
+
+        Returns:
+            int: 所在行索引，未显示时返回-1
+        """
+        row = self.row_of(package.get("name"))
+        if row >= 0:
+            self._rows[row] = package
+            self.refresh_row(row)
+        return row
+
+    def checked_rows(self):
+        """获取通过复选框选中的行
+
+        选中集合随setData/set_all_checked增量维护，这里直接返回其副本，
+        开销只与选中行数有关，不需要扫描整个表格
+        """
+        return set(self._checked_rows)
+
+    def set_all_checked(self, checked):
+        """全选或取消全选所有行
+
+        Args:
+            checked: 是否选中
+        """
+        checked_rows = set(range(len(self._rows))) if checked else set()
+        if checked_rows == self._checked_rows:
+            # 状态没有变化，不通知视图
+            return
+
+        # 一次性替换选中集合（包括尚未加载的行），并只发出一个覆盖已加载行的dataChanged信号
+        self._checked_rows = checked_rows
+        if self._loaded:
+            top_left = self.index(0, 0)
+            bottom_right = self.index(self._loaded - 1, 0)
+            self.dataChanged.emit(top_left, bottom_right, [Qt.CheckStateRole])
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 """定时检查方法模块"""
+from ...modules.async_executor import run_async_task
 
 def _connect_scheduler_signals(self):
     """连接定时检查模块的信号"""
@@ -32,7 +33,6 @@ def _handle_aur_scheduled_check(self):
         self._init_version_services()
 
         # 使用批量方法一次性检查所有AUR版本
-        from src.modules.async_executor import run_async_task
         run_async_task(
             self.aur_checker.check_multiple_aur_versions([p["name"] for p in packages]),
             self._on_scheduled_aur_check_completed,
@@ -60,7 +60,6 @@ def _handle_upstream_scheduled_check(self):
         self._init_version_services()
 
         # 执行批量上游版本检查
-        from src.modules.async_executor import run_async_task
         run_async_task(
             self.main_checker.check_multiple_upstream_versions(packages),
             self._on_scheduled_upstream_check_completed,
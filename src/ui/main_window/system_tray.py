@@ -3,8 +3,41 @@
 系统托盘相关功能模块
 """
 import os
+from functools import lru_cache
 from PySide6.QtWidgets import QSystemTrayIcon, QMenu, QApplication
 from PySide6.QtGui import QIcon, QAction
+from PySide6.QtCore import Slot
+
+from ...modules.async_executor import run_async_task
+
+# 托盘图标的候选路径，模块导入时计算一次
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+_TRAY_ICON_PATHS = (
+    os.path.join(_MODULE_DIR, "..", "..", "..", "assets", "tray.png"),
+    os.path.join(_MODULE_DIR, "..", "..", "assets", "tray.png"),
+    os.path.join("assets", "tray.png")
+)
+# 第一个存在的图标文件，都不存在时为None
+_TRAY_ICON_PATH = next((path for path in _TRAY_ICON_PATHS if os.path.exists(path)), None)
+
+# 旧版本配置中使用的关闭行为值到当前值的映射
+_CLOSE_ACTION_MAP = {
+    "直接退出": "exit",
+    "最小化到托盘": "minimize"
+}
+
+
+@lru_cache(maxsize=None)
+def _get_tray_icon():
+    """获取托盘图标，首次调用时创建，之后所有窗口复用同一个QIcon
+
+    QIcon需要在QApplication创建之后构造，因此不在模块导入时创建
+
+    Returns:
+        QIcon: 托盘图标，未找到图标文件时返回None
+    """
+    return QIcon(_TRAY_ICON_PATH) if _TRAY_ICON_PATH else None
+
 
 class SystemTrayMixin:
     """系统托盘相关的方法混入类"""
@@ -13,20 +46,15 @@ class SystemTrayMixin:
         """初始化系统托盘"""
         self.tray_icon = QSystemTrayIcon(self)
 
+        # 缓存应用实例和关闭行为，关闭窗口时不再重复查找
+        self._qapp = QApplication.instance()
+        self._close_action = None
+        self._migrate_close_action_config()
+
         # 加载托盘图标
-        # 尝试从多个路径加载图标
-        icon_paths = [
-            os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "assets", "tray.png"),
-            os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "assets", "tray.png"),
-            os.path.join("assets", "tray.png")
-        ]
-        
-        for icon_path in icon_paths:
-            self.logger.debug(f"尝试加载托盘图标路径: {icon_path}")
-            if os.path.exists(icon_path):
-                self.logger.debug(f"文件存在: {icon_path}")
-                self.tray_icon.setIcon(QIcon(icon_path))
-                break
+        tray_icon = _get_tray_icon()
+        if tray_icon is not None:
+            self.tray_icon.setIcon(tray_icon)
         else:
             self.logger.warning("未找到托盘图标文件")
 
@@ -68,6 +96,7 @@ class SystemTrayMixin:
         # 显示托盘图标
         self.tray_icon.show()
 
+    @Slot(QSystemTrayIcon.ActivationReason)
     def tray_icon_activated(self, reason):
         """托盘图标被激活时的处理
 
@@ -79,64 +108,58 @@ class SystemTrayMixin:
             self.showNormal()
             self.activateWindow()
 
+    @Slot()
     def close_application(self):
         """关闭应用"""
-        QApplication.quit()
+        self._qapp.quit()
         
-    def _tray_check_aur(self):
-        """从托盘菜单触发：检查 AUR 版本更新"""
-        try:
-            self.logger.info("从托盘菜单触发 AUR 版本检查")
-            # 显示窗口
-            self.showNormal()
-            self.activateWindow()
-            # 获取所有软件包并执行批量检查
-            packages = self.db.get_all_packages()
-            if not packages:
-                self.logger.warning("没有找到任何软件包，无法执行检查")
-                return
-            # 初始化服务
-            self._init_version_services()
-            # 准备包名列表
-            package_names = [p["name"] for p in packages if "name" in p]
-            if package_names:
-                from src.modules.async_executor import run_async_task
-                run_async_task(
-                    self.aur_checker.check_multiple_aur_versions(package_names),
-                    self._on_batch_check_completed,
-                    self._on_batch_check_error
-                )
-                self.logger.info(f"已提交 {len(package_names)} 个软件包的 AUR 版本检查任务")
-            else:
-                self.logger.warning("没有有效的软件包名称，无法执行检查")
-        except Exception as e:
-            self.logger.error(f"从托盘菜单触发 AUR 版本检查时出错: {str(e)}")
-            
-    def _tray_check_upstream(self):
-        """从托盘菜单触发：检查上游版本更新"""
+    def _tray_dispatch_check(self, check_name, coro_factory, show_window=True):
+        """托盘触发的批量检查的公共流程
+
+        Args:
+            check_name: 检查名称，用于日志
+            coro_factory: 接收软件包列表、返回检查协程的函数
+            show_window: 是否先显示主窗口
+        """
         try:
-            self.logger.info("从托盘菜单触发上游版本检查")
-            # 显示窗口
-            self.showNormal()
-            self.activateWindow()
-            # 获取所有软件包并执行批量检查
+            self.logger.info(f"从托盘菜单触发{check_name}检查")
+            if show_window:
+                # 显示窗口
+                self.showNormal()
+                self.activateWindow()
+            # 获取所有软件包并执行批量检查，数据库层已缓存该查询
             packages = self.db.get_all_packages()
             if not packages:
-                self.logger.warning("没有找到任何软件包，无法执行检查")
+                self.logger.warning(f"没有找到任何软件包，无法执行{check_name}检查")
                 return
             # 初始化服务
             self._init_version_services()
-            # 执行批量上游版本检查
-            from src.modules.async_executor import run_async_task
             run_async_task(
-                self.main_checker.check_multiple_upstream_versions(packages),
+                coro_factory(packages),
                 self._on_batch_check_completed,
                 self._on_batch_check_error
             )
-            self.logger.info(f"已提交 {len(packages)} 个软件包的上游版本检查任务")
+            self.logger.info(f"已提交 {len(packages)} 个软件包的{check_name}检查任务")
         except Exception as e:
-            self.logger.error(f"从托盘菜单触发上游版本检查时出错: {str(e)}")
-            
+            self.logger.error(f"从托盘菜单触发{check_name}检查时出错: {str(e)}")
+
+    @Slot()
+    def _tray_check_aur(self):
+        """从托盘菜单触发：检查 AUR 版本更新"""
+        self._tray_dispatch_check(
+            " AUR 版本",
+            lambda packages: self.aur_checker.check_multiple_aur_versions([p["name"] for p in packages if "name" in p])
+        )
+
+    @Slot()
+    def _tray_check_upstream(self):
+        """从托盘菜单触发：检查上游版本更新"""
+        self._tray_dispatch_check(
+            "上游版本",
+            lambda packages: self.main_checker.check_multiple_upstream_versions(packages)
+        )
+
+    @Slot()
     def _tray_check_both(self):
         """从托盘菜单触发：检查 AUR 和上游版本更新"""
         try:
@@ -164,22 +187,35 @@ class SystemTrayMixin:
             
     def _delayed_upstream_check(self):
         """延迟执行的上游版本检查"""
-        try:
-            # 获取所有软件包
-            packages = self.db.get_all_packages()
-            if not packages:
-                self.logger.warning("没有找到任何软件包，无法执行上游版本检查")
-                return
-            # 执行批量上游版本检查
-            from src.modules.async_executor import run_async_task
-            run_async_task(
-                self.main_checker.check_multiple_upstream_versions(packages),
-                self._on_batch_check_completed,
-                self._on_batch_check_error
-            )
-            self.logger.info(f"已提交 {len(packages)} 个软件包的上游版本检查任务")
-        except Exception as e:
-            self.logger.error(f"延迟执行上游版本检查时出错: {str(e)}")
+        self._tray_dispatch_check(
+            "上游版本",
+            lambda packages: self.main_checker.check_multiple_upstream_versions(packages),
+            show_window=False
+        )
+
+    def _migrate_close_action_config(self):
+        """把配置中旧版本的关闭行为值一次性改写为当前值，之后读取时无需再转换"""
+        close_action = self.config.get('ui.close_action')
+        if close_action in _CLOSE_ACTION_MAP:
+            self.config.set('ui.close_action', _CLOSE_ACTION_MAP[close_action], auto_save=True)
+            self.logger.info(f"已迁移旧的关闭行为配置: {close_action} -> {_CLOSE_ACTION_MAP[close_action]}")
+
+    @Slot()
+    def _invalidate_close_action(self):
+        """清除缓存的关闭行为，设置保存后下次关闭窗口时重新读取"""
+        self._close_action = None
+
+    def _get_close_action(self):
+        """获取关闭行为配置，首次读取后缓存，设置保存后清除缓存
+
+        Returns:
+            str: "exit"或"minimize"
+        """
+        if self._close_action is None:
+            # 读取关闭行为配置，可能是"exit"或"minimize"，兼容处理可能存在的旧配置值
+            close_action = self.config.get('ui.close_action', "minimize")
+            self._close_action = _CLOSE_ACTION_MAP.get(close_action, close_action)
+        return self._close_action
 
     def handle_close_event(self, event):
         """处理窗口关闭事件
@@ -187,20 +223,14 @@ class SystemTrayMixin:
         Args:
             event: 关闭事件
         """
-        # 读取关闭行为配置，可能是"exit"或"minimize"
-        close_action = self.config.get('ui.close_action', "minimize")
-        # 兼容处理可能存在的旧配置值
-        if close_action == "直接退出":
-            close_action = "exit"
-        elif close_action == "最小化到托盘":
-            close_action = "minimize"
+        close_action = self._get_close_action()
         self.logger.info(f"关闭行为配置: {close_action}")
         
         if close_action == "exit":
             # 配置为退出程序
             self.logger.info("配置为退出程序，执行退出")
             event.accept()
-            QApplication.quit()
+            self._qapp.quit()
         else:
             # 配置为最小化到托盘
             if self.tray_icon.isVisible():
@@ -211,5 +241,5 @@ class SystemTrayMixin:
                 # 托盘不可见时，无法最小化，只能退出
                 self.logger.info("托盘不可见，执行退出")
                 event.accept()
-                QApplication.quit()
+                self._qapp.quit()
 
@@ -1,12 +1,16 @@
 # -*- coding: utf-8 -*-
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, Slot
 
 class TableSortMixin:
     """表格排序相关的方法混入类"""
 
+    @Slot(int, Qt.SortOrder)
     def on_sort_indicator_changed(self, logical_index, order):
         """当表格排序指示器变化时被调用
 
+        排序本身和当前排序设置都由PackageTableModel负责，重新加载数据后模型会自动按原设置排序，
+        这里只记录日志
+
         Args:
             logical_index: 排序列的逻辑索引
             order: 排序顺序 (Qt.AscendingOrder 或 Qt.DescendingOrder)
@@ -15,15 +19,8 @@ class TableSortMixin:
         if logical_index == 0:
             return
             
-        # 获取列名
-        header_item = self.packages_table.horizontalHeaderItem(logical_index)
-        column_name = header_item.text() if header_item else f"列 {logical_index}"
-        
-        # 记录排序操作
-        order_name = "升序" if order == Qt.AscendingOrder else "降序"
-        self.logger.info(f"对{column_name}({logical_index})进行{order_name}排序")
-        
-        # 在UI更新前禁用排序，避免列内容出现异常
-        # 保存当前排序设置，以便在更新数据后恢复
-        self.packages_table.setProperty("last_sort_column", logical_index)
-        self.packages_table.setProperty("last_sort_order", order)
+        # 只在INFO级别启用时才查询列名并格式化日志
+        if self.logger.is_enabled_for("INFO"):
+            column_name = self.packages_model.headerData(logical_index, Qt.Horizontal) or f"列 {logical_index}"
+            order_name = "升序" if order == Qt.AscendingOrder else "降序"
+            self.logger.info(f"对{column_name}({logical_index})进行{order_name}排序")
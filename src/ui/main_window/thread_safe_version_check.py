@@ -4,6 +4,9 @@
 """
 from typing import Dict, List, Any, Optional, Callable, Union
 from PySide6.QtCore import QObject, Signal, Slot, QTimer
+from PySide6.QtWidgets import QApplication
+import itertools
+import threading
 import traceback
 import time
 
@@ -22,6 +25,12 @@ from ..protocols import MainWindowInterface
 class ThreadSafeVersionCheckMixin:
     """线程安全的版本检查混入类，优化后台任务处理流程"""
 
+    # 工作线程向UI线程调度进度刷新的最小间隔（秒）
+    _PROGRESS_DISPATCH_INTERVAL = 0.033
+
+    # 检查任务序号，保证任务ID单调递增且不会重复
+    _task_seq = itertools.count()
+
     def __init_thread_safe_check(self):
         """初始化线程安全版本检查功能"""
         # 获取全局任务管理器
@@ -37,11 +46,62 @@ class ThreadSafeVersionCheckMixin:
         self._ui_update_timer.setInterval(100)  # 100ms延迟
         self._ui_update_timer.timeout.connect(self._update_ui_from_pending)
 
-        # 待更新包的列表
-        self._pending_ui_updates = set()
+        # 待更新的包，以dict作为有序集合：重复的包自动合并，顺序确定；
+        # 工作线程和UI线程都会访问，读写时需持有_progress_lock
+        self._pending_ui_updates = {}
+
+        # 待写入数据库的上游版本，随UI更新计时器一起批量提交
+        self._pending_db_updates = []
+
+        # 批量检查进度和待更新的包，由工作线程写入、UI计时器读取，访问时需持有锁
+        self._progress_lock = threading.Lock()
+        self._progress_current = 0
+        self._progress_total = 0
 
         # 记录正在进行的检查
         self._active_checks = {}  # package_name -> task_id
+        self._task_id_to_name = {}  # task_id -> package_name，与_active_checks同步维护，只在UI线程中读写
+
+        # 常驻的后台事件循环，所有检查协程都提交到这里执行，
+        # 避免每次检查都创建和销毁事件循环，也让HTTP连接池可以跨检查复用
+        self._bg_loop = asyncio.new_event_loop()
+        self._bg_loop_thread = threading.Thread(
+            target=self._bg_loop.run_forever,
+            name="version-check-loop",
+            daemon=True
+        )
+        self._bg_loop_thread.start()
+
+        # 退出应用时停止并关闭后台事件循环
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._shutdown_bg_loop)
+
+    def _shutdown_bg_loop(self):
+        """停止常驻后台事件循环，等待线程结束后关闭循环"""
+        loop = getattr(self, "_bg_loop", None)
+        if loop is None or loop.is_closed():
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        self._bg_loop_thread.join(timeout=5)
+        if self._bg_loop_thread.is_alive():
+            self.logger.warning("后台事件循环未能在超时时间内停止")
+            return
+        loop.close()
+
+    def _run_on_bg_loop(self, coro):
+        """在常驻后台事件循环中执行协程并等待结果
+
+        这个方法在工作线程中调用，会阻塞直到协程完成
+
+        Args:
+            coro: 要执行的协程
+
+        Returns:
+            协程的返回值
+        """
+        future = asyncio.run_coroutine_threadsafe(coro, self._bg_loop)
+        return future.result()
 
     @ui_thread_safe
     def check_package_version(self, name=None, upstream_url=None, checker_type=None, version_extract_key=None):
@@ -104,12 +164,13 @@ class ThreadSafeVersionCheckMixin:
         task_id = self.task_manager.schedule_task(
             self._do_check_version,
             package_info,
-            task_id=f"check_{name}_{time.time()}",
+            task_id=f"check_{name}_{next(self._task_seq)}",  # 任务管理器的信号要求字符串ID
             priority=TaskPriority.NORMAL
         )
 
         # 记录活动检查
         self._active_checks[name] = task_id
+        self._task_id_to_name[task_id] = name
 
     def _do_check_version(self, package_info):
         """执行版本检查的后台任务
@@ -124,20 +185,15 @@ class ThreadSafeVersionCheckMixin:
         """
         try:
             # 调用主检查器的检查方法
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-            try:
-                result = loop.run_until_complete(
-                    self.main_checker.check_single_upstream_version(package_info)
-                )
-                return result
-            finally:
-                loop.close()
+            return self._run_on_bg_loop(
+                self.main_checker.check_single_upstream_version(package_info)
+            )
 
         except Exception as e:
             self.logger.error(f"检查版本出错: {str(e)}")
-            self.logger.debug(traceback.format_exc())
+            # 只在DEBUG级别启用时才格式化调用栈
+            if self.logger.is_enabled_for("DEBUG"):
+                self.logger.debug(traceback.format_exc())
             return {
                 "name": package_info.get("name", "unknown"),
                 "success": False,
@@ -152,29 +208,20 @@ class ThreadSafeVersionCheckMixin:
             task_id: 任务ID
             result: 任务结果
         """
-        # 查找对应的包名
-        package_name = None
-        for name, tid in list(self._active_checks.items()):
-            if tid == task_id:
-                package_name = name
-                del self._active_checks[name]
-                break
-
+        # 通过反向映射查找对应的包名
+        package_name = self._task_id_to_name.pop(task_id, None)
         if not package_name:
             return
+        self._active_checks.pop(package_name, None)
 
         # 处理结果
         if isinstance(result, dict) and "name" in result:
-            # 更新数据库
+            # 记录待写入数据库的版本，由UI更新计时器在一个事务中批量写入
             if result.get("success") and result.get("upstream_version"):
-                try:
-                    self.db.update_upstream_version(
-                        result["name"],
-                        result["upstream_version"]
-                    )
-                    self.logger.info(f"已更新 {result['name']} 的上游版本: {result['upstream_version']}")
-                except Exception as e:
-                    self.logger.error(f"更新数据库时出错: {str(e)}")
+                self._pending_db_updates.append({
+                    "name": result["name"],
+                    "version": result["upstream_version"]
+                })
 
             # 安排UI更新
             self._schedule_ui_update(result["name"])
@@ -187,16 +234,11 @@ class ThreadSafeVersionCheckMixin:
             task_id: 任务ID
             error_msg: 错误消息
         """
-        # 查找对应的包名
-        package_name = None
-        for name, tid in list(self._active_checks.items()):
-            if tid == task_id:
-                package_name = name
-                del self._active_checks[name]
-                break
-
+        # 通过反向映射查找对应的包名
+        package_name = self._task_id_to_name.pop(task_id, None)
         if not package_name:
             return
+        self._active_checks.pop(package_name, None)
 
         # 显示错误状态
         self._update_package_check_status(package_name, f"失败: {error_msg}")
@@ -210,28 +252,64 @@ class ThreadSafeVersionCheckMixin:
         Args:
             package_name: 包名
         """
-        # 添加到待更新列表
-        self._pending_ui_updates.add(package_name)
+        # 添加到待更新队列
+        with self._progress_lock:
+            self._pending_ui_updates[package_name] = None
 
-        # 如果计时器未运行，启动它
+        self._start_ui_update_timer()
+
+    @ui_thread_safe
+    def _start_ui_update_timer(self):
+        """启动UI更新计时器，计时器运行中时不重复启动"""
         if not self._ui_update_timer.isActive():
             self._ui_update_timer.start()
 
     @ui_thread_safe
     def _update_ui_from_pending(self):
-        """从待更新列表中更新UI"""
-        if not self._pending_ui_updates:
-            return
-
-        # 更新所有待更新的包
-        for package_name in list(self._pending_ui_updates):
-            self.update_package_after_check(package_name)
+        """从待更新列表和进度计数器中更新UI"""
+        # 读取最新进度
+        with self._progress_lock:
+            current, total = self._progress_current, self._progress_total
+
+        # 只显示最新的进度，中间值直接跳过
+        if total:
+            self._update_progress_dialog(current, total)
+
+        # 先把累积的版本在一个事务中写入数据库，之后的行更新会从数据库读取最新数据
+        self._flush_pending_db_updates()
+
+        # 在锁内取走整个待更新集合，之后的处理不再持有锁
+        with self._progress_lock:
+            pending = self._pending_ui_updates
+            if not pending:
+                return
+            self._pending_ui_updates = {}
 
-        # 清空待更新列表
-        self._pending_ui_updates.clear()
+        # 批量写入期间暂停表格重绘，所有行更新完成后只重绘一次
+        self.packages_table.setUpdatesEnabled(False)
+        try:
+            # 同一个包在集合中只会出现一次
+            for package_name in pending:
+                self.update_package_after_check(package_name)
+
+            # 所有行写入后只刷新一次过滤
+            self.filter_packages()
+        finally:
+            self.packages_table.setUpdatesEnabled(True)
+
+    def _flush_pending_db_updates(self):
+        """把累积的上游版本一次性写入数据库"""
+        if not self._pending_db_updates:
+            return
 
-        # 刷新过滤
-        self.filter_packages()
+        updates = self._pending_db_updates
+        self._pending_db_updates = []
+        try:
+            # update_multiple_upstream_versions使用executemany，只提交一次
+            count = self.db.update_multiple_upstream_versions(updates)
+            self.logger.info(f"已批量更新 {count} 个软件包的上游版本")
+        except Exception as e:
+            self.logger.error(f"更新数据库时出错: {str(e)}")
 
     @ui_thread_safe
     def _update_package_check_status(self, package_name, status):
@@ -241,15 +319,13 @@ class ThreadSafeVersionCheckMixin:
             package_name: 包名
             status: 状态文本
         """
-        # 查找表格中对应的行
-        for row in range(self.packages_table.rowCount()):
-            name_item = self.packages_table.item(row, 1)  # 名称列
-            if name_item and name_item.text() == package_name:
-                # 更新状态列
-                status_item = self.packages_table.item(row, 4)
-                if status_item:
-                    status_item.setText(status)
-                break
+        # 表格是基于PackageTableModel的QTableView，状态列由软件包数据计算得出，
+        # 临时的检查状态显示在状态栏中，并通过名称索引定位行通知视图重绘
+        self.statusBar().showMessage(f"{package_name}: {status}", 3000)
+
+        row = self.packages_model.row_of(package_name)
+        if row >= 0:
+            self.packages_model.refresh_row(row)
 
     @run_in_background
     def check_all_upstream_versions(self, packages=None):
@@ -270,29 +346,35 @@ class ThreadSafeVersionCheckMixin:
                 return
 
         # 显示进度
+        with self._progress_lock:
+            self._progress_current = 0
+            self._progress_total = len(packages)
         ThreadSafeUI.run_in_main_thread(self._show_progress_dialog, "检查上游版本", 0, len(packages))
 
         # 批量检查
         try:
-            # 创建新的事件循环
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-            try:
-                results = loop.run_until_complete(
-                    self.main_checker.check_multiple_upstream_versions(packages)
-                )
-
-                # 更新进度
-                for i, result in enumerate(results):
-                    ThreadSafeUI.run_in_main_thread(self._update_progress_dialog, i + 1, len(packages))
-
+            # 在常驻后台事件循环中执行批量检查
+            results = self._run_on_bg_loop(
+                self.main_checker.check_multiple_upstream_versions(packages)
+            )
+
+            # 更新进度计数器和待更新列表，UI计时器会读取最新状态
+            last_dispatch = 0.0
+            for i, result in enumerate(results):
+                with self._progress_lock:
+                    self._progress_current = i + 1
                     # 处理结果
                     if result.get("success") and "name" in result:
-                        # 安排UI更新
-                        self._schedule_ui_update(result["name"])
-            finally:
-                loop.close()
+                        self._pending_ui_updates[result["name"]] = None
+
+                # 限制跨线程调度的频率，约每秒30次
+                now = time.monotonic()
+                if now - last_dispatch > self._PROGRESS_DISPATCH_INTERVAL:
+                    last_dispatch = now
+                    ThreadSafeUI.run_in_main_thread(self._start_ui_update_timer)
+
+            # 确保最后的进度和结果被刷新
+            ThreadSafeUI.run_in_main_thread(self._start_ui_update_timer)
 
             # 完成后隐藏进度对话框
             ThreadSafeUI.run_in_main_thread(self._hide_progress_dialog)
@@ -302,7 +384,9 @@ class ThreadSafeVersionCheckMixin:
 
         except Exception as e:
             self.logger.error(f"批量检查出错: {str(e)}")
-            self.logger.debug(traceback.format_exc())
+            # 只在DEBUG级别启用时才格式化调用栈
+            if self.logger.is_enabled_for("DEBUG"):
+                self.logger.debug(traceback.format_exc())
 
             # 隐藏进度对话框并显示错误
             ThreadSafeUI.run_in_main_thread(self._hide_progress_dialog)
@@ -332,9 +416,14 @@ class ThreadSafeVersionCheckMixin:
     @ui_thread_safe
     def _update_progress_dialog(self, current, total):
         """更新进度对话框"""
-        if hasattr(self, '_progress_dialog') and self._progress_dialog is not None:
-            self._progress_dialog.setRange(0, total)
-            self._progress_dialog.setValue(current)
+        dialog = getattr(self, '_progress_dialog', None)
+        if dialog is None:
+            return
+        # 计时器每次触发都会调用，进度没有变化时不触发重绘
+        if dialog.maximum() != total:
+            dialog.setRange(0, total)
+        if dialog.value() != current:
+            dialog.setValue(current)
 
     @ui_thread_safe
     def _hide_progress_dialog(self):
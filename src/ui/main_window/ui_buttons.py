@@ -1,7 +1,68 @@
 # -*- coding: utf-8 -*-
+from types import MappingProxyType
 from PySide6.QtWidgets import QPushButton
 from PySide6.QtCore import QTimer
 
+# 按钮配色：样式名 -> (背景色, 文字颜色, 悬停背景色, 按下背景色)
+_BUTTON_STYLES = MappingProxyType({
+    "primary": ("#007bff", "white", "#0069d9", "#0062cc"),
+    "success": ("#28a745", "white", "#218838", "#1e7e34"),
+    "warning": ("#ffc107", "#212529", "#e0a800", "#d39e00"),
+    "danger": ("#dc3545", "white", "#c82333", "#bd2130")
+})
+
+# 按钮属性名到样式的映射
+_BUTTON_MAP = MappingProxyType({
+    # 添加包按钮
+    "add_package_button": "primary",
+
+    # 检查按钮
+    "check_aur_button": "success",
+    "check_upstream_button": "success",
+    "check_all_versions_button": "danger",
+
+    # 编辑按钮
+    "edit_package_button": "warning",
+
+    # 其他按钮
+    "refresh_button": "primary",
+    "select_all_toggle_button": "primary"
+})
+
+
+
+def _build_buttons_stylesheet():
+    """按样式分组生成所有按钮共用的样式表，按钮通过objectName选择器匹配"""
+    names_by_style = {}
+    for button_name, style_key in _BUTTON_MAP.items():
+        names_by_style.setdefault(style_key, []).append(button_name)
+
+    rules = []
+    for style_key, button_names in names_by_style.items():
+        background, color, hover, pressed = _BUTTON_STYLES[style_key]
+        selectors = [f"QPushButton#{name}" for name in button_names]
+        rules.append(f"""
+            {", ".join(selectors)} {{
+                background-color: {background};
+                color: {color};
+                border: none;
+                border-radius: 4px;
+                padding: 6px 12px;
+            }}
+            {", ".join(s + ":hover" for s in selectors)} {{
+                background-color: {hover};
+            }}
+            {", ".join(s + ":pressed" for s in selectors)} {{
+                background-color: {pressed};
+            }}
+        """)
+    return "".join(rules)
+
+
+# 所有彩色按钮共用的样式表，模块导入时生成一次
+_BUTTONS_STYLESHEET = _build_buttons_stylesheet()
+
+
 class UIButtons:
     """
     处理UI按钮样式和交互
@@ -12,101 +73,13 @@ class UIButtons:
         """
         初始化彩色按钮样式
         """
-        # 定义按钮样式
-        button_styles = {
-            "primary": """
-                QPushButton {
-                    background-color: #007bff;
-                    color: white;
-                    border: none;
-                    border-radius: 4px;
-                    padding: 6px 12px;
-                }
-                QPushButton:hover {
-                    background-color: #0069d9;
-                }
-                QPushButton:pressed {
-                    background-color: #0062cc;
-                }
-            """,
-            "success": """
-                QPushButton {
-                    background-color: #28a745;
-                    color: white;
-                    border: none;
-                    border-radius: 4px;
-                    padding: 6px 12px;
-                }
-                QPushButton:hover {
-                    background-color: #218838;
-                }
-                QPushButton:pressed {
-                    background-color: #1e7e34;
-                }
-            """,
-            "warning": """
-                QPushButton {
-                    background-color: #ffc107;
-                    color: #212529;
-                    border: none;
-                    border-radius: 4px;
-                    padding: 6px 12px;
-                }
-                QPushButton:hover {
-                    background-color: #e0a800;
-                }
-                QPushButton:pressed {
-                    background-color: #d39e00;
-                }
-            """,
-            "danger": """
-                QPushButton {
-                    background-color: #dc3545;
-                    color: white;
-                    border: none;
-                    border-radius: 4px;
-                    padding: 6px 12px;
-                }
-                QPushButton:hover {
-                    background-color: #c82333;
-                }
-                QPushButton:pressed {
-                    background-color: #bd2130;
-                }
-            """
-        }
-
-        # 应用样式函数
-        def apply_button_styles():
-            # 设置按钮样式，判断按钮是否存在再设置
-            button_map = {
-                # 添加包按钮
-                "add_package_button": "primary",
-                
-                # 检查按钮
-                "check_aur_button": "success",
-                "check_upstream_button": "success",
-                "check_all_versions_button": "danger",
-                
-                # 编辑按钮
-                "edit_package_button": "warning",
-                
-                # 其他按钮
-                "refresh_button": "primary",
-                "select_all_toggle_button": "primary"
-            }
-            
-            # 遍历按钮映射，设置样式
-            for button_name, style_key in button_map.items():
-                if hasattr(main_window, button_name):
-                    button = getattr(main_window, button_name)
-                    try:
-                        button.setStyleSheet(button_styles[style_key])
-                        main_window.logger.debug(f"成功设置按钮样式 {button_name}")
-                    except Exception as e:
-                        main_window.logger.error(f"设置按钮样式出错 {button_name}: {str(e)}")
-                else:
-                    main_window.logger.warning(f"按钮 {button_name} 不存在，无法设置样式")
+        # 按钮以属性名作为objectName，由主窗口上的一份样式表统一匹配
+        for button_name in _BUTTON_MAP:
+            button = getattr(main_window, button_name, None)
+            if button is not None:
+                button.setObjectName(button_name)
+            else:
+                main_window.logger.warning(f"按钮 {button_name} 不存在，无法设置样式")
 
-        # 直接应用样式，不使用延迟
-        apply_button_styles()
+        # 只设置一次样式表，Qt只需为所有按钮计算一次样式
+        main_window.setStyleSheet(_BUTTONS_STYLESHEET)
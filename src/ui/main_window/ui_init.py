@@ -4,10 +4,60 @@ UI初始化相关功能模块
 """
 from PySide6.QtWidgets import (
     QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QLineEdit, QTableWidget, QTableWidgetItem, QHeaderView, QCheckBox,
+    QLineEdit, QTableView, QAbstractItemView, QHeaderView, QCheckBox,
     QTabWidget, QWidget
 )
 from PySide6.QtCore import Qt
+from .package_table_model import PackageTableModel
+
+# 软件包表格样式表，使复选框在深色主题中更明显和居中
+_PACKAGES_TABLE_STYLE = """
+    /* 表格项样式 */
+    QTableView::item {
+        color: white;
+    }
+    /* 第一列(复选框列)的特殊样式 */
+    QTableView::item:first {
+        padding: 0px;
+        margin: 0px;
+        border-right: 1px solid #444;
+        background-color: rgba(80, 80, 80, 50);
+        color: transparent;
+    }
+
+    /* 复选框样式 - 自适应列宽的居中方法 */
+    QTableView::indicator {
+        width: 14px;
+        height: 14px;
+        border: 1px solid #666;
+        background: #333;
+        position: absolute;
+        left: 15%;
+        margin-left: -7px;  /* 负的宽度一半 */
+    }
+    QTableView::indicator:checked {
+        background: #4CAF50;
+        border: 1px solid #4CAF50;
+    }
+    /* 确保复选框容器使用相对定位 */
+    QTableView QCheckBox {
+        position: relative;
+    }
+"""
+
+# 软件包表格各列的宽度调整模式，按列索引排列，与PackageTableModel.HEADERS一一对应
+_COLUMN_RESIZE_MODES = (
+    QHeaderView.Fixed,          # 复选框
+    QHeaderView.Stretch,        # 名称
+    QHeaderView.Interactive,    # AUR版本
+    QHeaderView.Interactive,    # 上游版本
+    QHeaderView.Interactive,    # 状态
+    QHeaderView.Interactive,    # AUR检查时间
+    QHeaderView.Interactive,    # 上游检查时间
+    QHeaderView.Interactive,    # 检查器类型
+    QHeaderView.Interactive,    # 上游URL
+    QHeaderView.Stretch         # 备注
+)
 
 class UIInitMixin:
     """UI初始化相关的方法混入类"""
@@ -61,14 +111,18 @@ class UIInitMixin:
         """应用所有设置"""
         self.logger.info("应用所有设置")
 
-        # 更新表格显示
+        # 列对齐方式可能已修改，重新读取后更新表格显示
+        self.packages_model.reload_alignments()
         self.update_packages_table()
 
         # 刷新其他设置（托盘图标、关闭行为等）
         show_tray = self.config.get("system.show_tray", True)
-        if hasattr(self, 'tray_icon'):
+        if self.tray_icon is not None:
             self.tray_icon.setVisible(show_tray)
 
+        # 关闭行为可能已修改，下次关闭窗口时重新读取
+        self._invalidate_close_action()
+
         # 记录当前应用的配置
         self.logger.info(f"当前应用的关闭行为: {self.config.get('ui.close_action', 'minimize')}")
         self.logger.info(f"当前应用的托盘图标显示: {show_tray}")
@@ -135,90 +189,39 @@ class UIInitMixin:
         self.check_all_versions_button.setToolTip("同时检查已选择的软件包的AUR和上游版本\n可通过复选框或直接用鼠标选中行来选择")
         toolbar_layout.addWidget(self.check_all_versions_button)
 
-        # 软件包表格
-        self.packages_table = QTableWidget()
-        # 设置表格全局样式表，使复选框在深色主题中更明显和居中
-        self.packages_table.setStyleSheet("""
-            /* 表格项样式 */
-            QTableWidget::item {
-                color: white;
-            }
-            /* 第一列(复选框列)的特殊样式 */
-            QTableWidget::item:first {
-                padding: 0px;
-                margin: 0px;
-                border-right: 1px solid #444;
-                background-color: rgba(80, 80, 80, 50);
-                color: transparent;
-            }
-
-            /* 复选框样式 - 自适应列宽的居中方法 */
-            QTableWidget::indicator {
-                width: 14px;
-                height: 14px;
-                border: 1px solid #666;
-                background: #333;
-                position: absolute;
-                left: 15%;
-                margin-left: -7px;  /* 负的宽度一半 */
-            }
-            QTableWidget::indicator:checked {
-                background: #4CAF50;
-                border: 1px solid #4CAF50;
-            }
-            /* 确保复选框容器使用相对定位 */
-            QTableWidget QCheckBox {
-                position: relative;
-            }
-        """)
+        # 软件包表格，使用模型/视图结构，数据直接来自软件包列表
+        self.packages_model = PackageTableModel(self.config, self)
+        self.packages_table = QTableView()
+        self.packages_table.setModel(self.packages_model)
+        # 设置表格全局样式表
+        self.packages_table.setStyleSheet(_PACKAGES_TABLE_STYLE)
 
         # 设置表格属性
-        self.packages_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.packages_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         # 启用多行选择
-        self.packages_table.setSelectionMode(QTableWidget.ExtendedSelection)
-        self.packages_table.setColumnCount(10)
-        self.packages_table.setHorizontalHeaderLabels([
-            "", "名称", "AUR版本", "上游版本", "状态", "AUR检查时间", "上游检查时间", 
-            "检查器类型", "上游URL", "备注"
-        ])
-        # 设置列宽度调整模式
-        self.packages_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Fixed)
-        
+        self.packages_table.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        # 表头由PackageTableModel.HEADERS提供
         # 根据配置设置列的显示与调整模式
-        # 列的顺序必须与update_ui.py中的列顺序一致
-        column_configs = [
-            {"index": 1, "key": "name", "default_resize": QHeaderView.Stretch},
-            {"index": 2, "key": "aur_version", "default_resize": QHeaderView.ResizeToContents},
-            {"index": 3, "key": "upstream_version", "default_resize": QHeaderView.ResizeToContents},
-            {"index": 4, "key": "status", "default_resize": QHeaderView.ResizeToContents},
-            {"index": 5, "key": "aur_check_time", "default_resize": QHeaderView.ResizeToContents},
-            {"index": 6, "key": "upstream_check_time", "default_resize": QHeaderView.ResizeToContents},
-            {"index": 7, "key": "checker_type", "default_resize": QHeaderView.ResizeToContents},
-            {"index": 8, "key": "upstream_url", "default_resize": QHeaderView.ResizeToContents},
-            {"index": 9, "key": "notes", "default_resize": QHeaderView.Stretch}
-        ]
-        
-        # 应用列配置
-        for col_config in column_configs:
-            # 设置列的宽度调整模式
-            self.packages_table.horizontalHeader().setSectionResizeMode(
-                col_config["index"], 
-                col_config["default_resize"]
-            )
-            
-            # 注意：列的可见性在update_ui.py的update_packages_table方法中根据配置动态设置
-            # 在初始化时，我们只设置宽度调整模式，不需要在这里设置列显示状态
-            # 列的对齐方式是在update_ui.py的_create_table_row方法中设置的
+        # 列的顺序必须与PackageTableModel中的列顺序一致
+        # 数据列使用Interactive模式：ResizeToContents会在每次数据变化时重新扫描整列计算宽度，
+        # 这里只在加载软件包后按内容调整一次宽度（见load_packages）
+        # 注意：列的可见性在update_packages_table方法中根据配置动态设置
+        # 在初始化时，我们只设置宽度调整模式，不需要在这里设置列显示状态
+        # 列的对齐方式由PackageTableModel根据配置提供
+        header = self.packages_table.horizontalHeader()
+        for index, resize_mode in enumerate(_COLUMN_RESIZE_MODES):
+            header.setSectionResizeMode(index, resize_mode)
         self.packages_table.verticalHeader().setVisible(False)
-        self.packages_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.packages_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.packages_table.setColumnWidth(0, 30)  # 第一列(复选框列)宽度固定为30像素，确保充分显示
 
         # 添加表格右键菜单
         self.packages_table.setContextMenuPolicy(Qt.CustomContextMenu)
+        self._init_package_context_menu()
         self.packages_table.customContextMenuRequested.connect(self.show_package_context_menu)
 
         # 添加表格双击事件 - 用于复制内容
-        self.packages_table.cellDoubleClicked.connect(self.copy_cell_content)
+        self.packages_table.doubleClicked.connect(self.copy_cell_content)
         
         # 启用表格排序功能
         self.packages_table.setSortingEnabled(True)
@@ -230,7 +233,7 @@ class UIInitMixin:
         header.sortIndicatorChanged.connect(self.on_sort_indicator_changed)
         
         # 设置默认排序为第二列（软件包名称），升序
-        if self.packages_table.columnCount() > 1:
+        if self.packages_model.columnCount() > 1:
             header.setSortIndicator(1, Qt.AscendingOrder)
         
         self.logger.info("已启用表格排序功能")
@@ -2,24 +2,78 @@
 """
 版本检查相关功能模块, UI交互部分
 """
-from typing import TypeVar, cast
-from PySide6.QtWidgets import QTableWidgetItem, QMessageBox, QProgressBar
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QColor
+import asyncio
+import time
+from PySide6.QtWidgets import QMessageBox, QProgressBar
 from ...modules.async_executor import run_async_task
 from ...modules.main_checker import MainCheckerModule
 from ...modules.aur_checker import AurCheckerModule
-from ..protocols import MainWindowInterface
-
-# 类型变量，表示实现了MainWindowInterface的任何类
-T = TypeVar('T', bound=MainWindowInterface)
 
 class VersionCheckMixin:
     """版本检查相关的方法混入类，需要实现MainWindowInterface接口"""
 
+    # 数据库软件包记录的短期缓存时间（秒），同一批检查中的重复查询直接使用内存中的结果
+    _PACKAGE_LOOKUP_TTL = 3.0
+
+    # 暂存的AUR检查结果达到该数量时立即写入数据库，不再等待计时器
+    _AUR_WRITE_BATCH_SIZE = 50
+
+    def _get_package_cached(self, name):
+        """按名称获取数据库中的软件包记录，短时间内的重复查询使用缓存
+
+        Args:
+            name: 软件包名称
+
+        Returns:
+            dict: 软件包记录，不存在时返回None
+        """
+        now = time.monotonic()
+        cached = self._package_lookup_cache.get(name)
+        if cached is not None and now - cached[0] < self._PACKAGE_LOOKUP_TTL:
+            return cached[1]
+
+        package = self.db.get_package_by_name(name)
+        self._package_lookup_cache[name] = (now, package)
+        return package
+
+    def _queue_aur_write(self, name, version):
+        """暂存单个AUR检查结果，稍后与其他结果合并写入数据库
+
+        Args:
+            name: 软件包名称
+            version: AUR版本
+        """
+        self._pending_aur_versions[name] = version
+        if len(self._pending_aur_versions) >= self._AUR_WRITE_BATCH_SIZE:
+            self._flush_aur_writes()
+        elif not self._aur_write_timer.isActive():
+            self._aur_write_timer.start()
+
+    def _flush_aur_writes(self):
+        """将暂存的AUR检查结果一次性写入数据库"""
+        self._aur_write_timer.stop()
+        if not self._pending_aur_versions:
+            return
+
+        pending = self._pending_aur_versions
+        self._pending_aur_versions = {}
+        updates = [{"name": name, "version": version} for name, version in pending.items()]
+        try:
+            updated_count = self.db.update_multiple_aur_versions(updates)
+            self.logger.debug(f"已批量写入 {updated_count} 个软件包的AUR检查结果")
+        except Exception as e:
+            self.logger.error(f"批量写入AUR检查结果失败: {str(e)}")
+
     def _init_version_services(self):
-        """初始化版本检查相关服务"""
-        if not hasattr(self, "main_checker") or self.main_checker is None:
+        """初始化版本检查相关服务
+
+        检查器只创建一次，之后的调用直接返回，保证检查器及其HTTP会话在多次检查间复用
+        """
+        if self._services_initialized:
+            return
+
+        # 主窗口在构造时已创建AUR检查器，主检查器在首次检查时才创建
+        if getattr(self, "main_checker", None) is None:
             self.main_checker = MainCheckerModule(
                 self.logger,
                 self.db,
@@ -27,13 +81,21 @@ class VersionCheckMixin:
             )
             self.logger.debug("版本检查模块已初始化")
 
-        if not hasattr(self, "aur_checker") or self.aur_checker is None:
+        if getattr(self, "aur_checker", None) is None:
             self.aur_checker = AurCheckerModule(
                 self.logger,
                 self.db
             )
             self.logger.debug("AUR检查模块已初始化")
 
+        # 混入类的组合在构造后就固定了，界面相关的可选能力只解析一次
+        self._status_bar = getattr(self, "status_bar", None)
+        self._status_bar_getter = getattr(self, "statusBar", None)
+        self._refresh_package_list = getattr(self, "refresh_package_list", None)
+        self._update_packages_table = getattr(self, "update_packages_table", None)
+
+        self._services_initialized = True
+
     def check_package_version(self, name=None, upstream_url=None, checker_type=None, version_extract_key=None):
         """检查单个软件包版本"""
         self.logger.info(f"开始检查软件包 {name} 版本")
@@ -45,9 +107,11 @@ class VersionCheckMixin:
             "upstream_url": upstream_url
         }
 
-        # 尝试从数据库获取完整的包信息
+        # 调用方没有提供checker_type或version_extract_key时，才从数据库补全包信息
         try:
-            db_package = self.db.get_package_by_name(name)
+            db_package = None
+            if not checker_type or not version_extract_key:
+                db_package = self._get_package_cached(name)
             if db_package:
                 # 如果未提供checker_type，尝试从数据库获取
                 if not checker_type and "checker_type" in db_package:
@@ -121,42 +185,38 @@ class VersionCheckMixin:
     def _on_version_check_completed(self, result):
         if not result:
             return
-        package_name = result.get("name")
-        if package_name:
-            self.update_package_after_check(package_name)
         self.logger.info(f"版本检查完成: {result}")
 
+        package_name = result.get("name")
+        if not package_name or not result.get("success"):
+            return
+
         # 更新数据库中的检查时间
         try:
-            package_name = result.get("name")
-            if package_name and result.get("success"):
-                # 获取当前时间
-                from datetime import datetime
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-                # 更新上游版本检查时间
-                # 由于没有单独的更新检查日期方法，我们保持当前版本不变，只更新日期
-                package = self.db.get_package_by_name(package_name)
-                if package and "upstream_version" in package:
-                    self.db.update_upstream_version(package_name, package["upstream_version"])
-                self.logger.debug(f"已更新 {package_name} 的检查时间: {current_time}")
-
-                # 立即更新UI - 尝试多种方法以确保界面刷新
-                # 先尝试使用reload_packages方法
-                if hasattr(self, "reload_packages") and callable(self.reload_packages):
-                    self.logger.debug("使用reload_packages更新上游版本检查后的UI")
-                    self.reload_packages()
-                # 如果没有reload_packages方法，则尝试使用update_package_after_check更新单个包
-                elif hasattr(self, "update_package_after_check") and callable(self.update_package_after_check):
-                    self.logger.debug(f"使用update_package_after_check更新{package_name}的UI")
-                    self.update_package_after_check(package_name)
-                # 最后尝试使用refresh_package_list
-                elif hasattr(self, "refresh_package_list") and callable(self.refresh_package_list):
-                    self.logger.debug("使用refresh_package_list更新UI")
-                    self.refresh_package_list()
+            # 检查到版本时，检查器已经把上游版本和检查时间写入数据库；
+            # 没有版本时只刷新检查时间，不再先查询记录再原样写回
+            if not result.get("upstream_version"):
+                self.db.touch_upstream_check_time(package_name)
+            self.logger.debug(f"已更新 {package_name} 的检查时间")
+
+            # 更新UI：只同步该软件包并重绘所在行，不再整体重新加载列表
+            self._refresh_after_check(result, "上游")
         except Exception as e:
             self.logger.error(f"更新检查时间失败: {str(e)}")
 
+    def _refresh_after_check(self, result, kind):
+        """单个检查完成后同步界面
+
+        检查结果直接写入内存中的软件包并只重绘所在行；软件包不在内存中时
+        交给合并刷新计时器，短时间内的多次完成回调只重新加载一次列表
+
+        Args:
+            result: 检查结果
+            kind: 检查类型名称，如 "AUR" 或 "上游"
+        """
+        if not self._apply_check_results([result], kind):
+            self._schedule_refresh()
+
     def _on_version_check_error(self, error):
         self.logger.error(f"版本检查出错: {str(error)}")
 
@@ -164,28 +224,22 @@ class VersionCheckMixin:
         if not results:
             return
         self.logger.info(f"批量版本检查完成: {len(results)}个结果")
+
+        # 先写入暂存的单个AUR结果，避免其晚于批量结果落盘
+        self._flush_aur_writes()
         
         # 使用批量更新功能更新数据库
         try:
-            # 准备批量更新数据
-            aur_updates = []
-            upstream_updates = []
-            
-            for result in results:
-                if result.get("success") and result.get("name"):
-                    # AUR 更新
-                    if "version" in result and "found" in result and result["found"]:
-                        aur_updates.append({
-                            "name": result["name"],
-                            "version": result["version"]
-                        })
-                    
-                    # 上游更新
-                    if "upstream_version" in result:
-                        upstream_updates.append({
-                            "name": result["name"],
-                            "version": result["upstream_version"]
-                        })
+            # 准备批量更新数据，每类更新用一次列表推导完成
+            succeeded = [r for r in results if r.get("success") and r.get("name")]
+            aur_updates = [
+                {"name": r["name"], "version": r["version"]}
+                for r in succeeded if r.get("found") and "version" in r
+            ]
+            upstream_updates = [
+                {"name": r["name"], "version": r["upstream_version"]}
+                for r in succeeded if "upstream_version" in r
+            ]
             
             # 批量更新AUR版本
             if aur_updates:
@@ -198,15 +252,15 @@ class VersionCheckMixin:
                 self.logger.info(f"批量更新了 {upstream_updated} 个软件包的上游版本")
                 
             # 如果表格已加载，则更新UI
-            if hasattr(self, "refresh_package_list") and callable(self.refresh_package_list):
-                self.refresh_package_list()
+            if self._refresh_package_list is not None:
+                self._refresh_package_list()
                 
         except Exception as e:
             self.logger.error(f"批量更新数据库失败: {str(e)}")
             
         # 通知用户检查完成
-        if hasattr(self, "statusBar"):
-            self.statusBar().showMessage(f"批量检查完成: {len(results)}个软件包", 5000)
+        if self._status_bar_getter is not None:
+            self._status_bar_getter().showMessage(f"批量检查完成: {len(results)}个软件包", 5000)
 
     def _on_batch_check_error(self, error):
         self.logger.error(f"批量版本检查出错: {str(error)}")
@@ -216,38 +270,15 @@ class VersionCheckMixin:
             return
         self.logger.info(f"AUR版本检查完成: {result}")
 
-        # 更新数据库中的 AUR 检查时间
+        # 暂存AUR检查结果，短时间内的多个结果合并为一次数据库写入
         try:
             package_name = result.get("name")
             if package_name and result.get("success"):
-                # 获取当前时间
-                from datetime import datetime
-                current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-                # 更新 AUR 版本检查时间
-                # 使用新的批量更新方法
                 if "version" in result:
-                    updated_count = self.db.update_multiple_aur_versions([{
-                        "name": package_name,
-                        "version": result["version"]
-                    }])
-                    
-                    if updated_count > 0:
-                        self.logger.debug(f"已更新 {package_name} 的 AUR 检查时间: {current_time}")
-
-                # 立即更新UI - 尝试多种方法以确保界面刷新
-                # 先尝试使用reload_packages方法
-                if hasattr(self, "reload_packages") and callable(self.reload_packages):
-                    self.logger.debug("使用reload_packages更新UI")
-                    self.reload_packages()
-                # 如果没有reload_packages方法，则尝试使用update_package_after_check更新单个包
-                elif hasattr(self, "update_package_after_check") and callable(self.update_package_after_check):
-                    self.logger.debug(f"使用update_package_after_check更新{package_name}的UI")
-                    self.update_package_after_check(package_name)
-                # 最后尝试使用refresh_package_list
-                elif hasattr(self, "refresh_package_list") and callable(self.refresh_package_list):
-                    self.logger.debug("使用refresh_package_list更新UI")
-                    self.refresh_package_list()
+                    self._queue_aur_write(package_name, result["version"])
+
+                # 更新UI：只同步该软件包并重绘所在行，不再整体重新加载列表
+                self._refresh_after_check(result, "AUR")
         except Exception as e:
             self.logger.error(f"更新 AUR 检查时间失败: {str(e)}")
 
@@ -303,16 +334,16 @@ class VersionCheckMixin:
 
         self.logger.info(f"开始批量检查 {len(selected_packages)} 个选中的软件包的AUR版本")
 
+        # 初始化服务
+        self._init_version_services()
+
         # 创建进度条
         progress_bar = None
-        if hasattr(self, "status_bar"):
+        if self._status_bar is not None:
             progress_bar = QProgressBar()
             progress_bar.setMaximum(len(selected_packages))
             progress_bar.setValue(0)
-            self.status_bar.addWidget(progress_bar)
-
-        # 初始化AUR检查器
-        self._init_version_services()
+            self._status_bar.addWidget(progress_bar)
 
         # 准备包名列表用于批量查询
         package_names = []
@@ -324,34 +355,32 @@ class VersionCheckMixin:
         if not package_names:
             self.logger.warning("没有有效的包名用于检查")
             if progress_bar:
-                self.status_bar.removeWidget(progress_bar)
+                self._status_bar.removeWidget(progress_bar)
             return
 
         # 使用批量API进行异步检查
-        from src.modules.async_executor import run_async_task
-
         def on_batch_check_completed(results):
             # 完成检查，更新UI
             self.logger.info(f"批量AUR检查完成，结果数: {len(results)}")
 
             # 移除进度条
-            if progress_bar and hasattr(self, "status_bar"):
-                self.status_bar.removeWidget(progress_bar)
-                self.status_bar.showMessage(f"已完成 {len(results)} 个软件包的AUR版本检查", 3000)
+            if progress_bar:
+                self._status_bar.removeWidget(progress_bar)
+                self._status_bar.showMessage(f"已完成 {len(results)} 个软件包的AUR版本检查", 3000)
 
             # 更新表格数据
-            if hasattr(self, "update_packages_table"):
-                self.update_packages_table()
+            if self._update_packages_table is not None:
+                self._update_packages_table()
 
         def on_batch_check_error(error):
             self.logger.error(f"批量检查AUR版本时发生错误: {str(error)}")
-            if progress_bar and hasattr(self, "status_bar"):
-                self.status_bar.removeWidget(progress_bar)
-                self.status_bar.showMessage(f"检查过程中发生错误", 3000)
+            if progress_bar:
+                self._status_bar.removeWidget(progress_bar)
+                self._status_bar.showMessage(f"检查过程中发生错误", 3000)
 
         # 更新进度条状态为"正在检查"
-        if hasattr(self, "status_bar"):
-            self.status_bar.showMessage(f"正在批量检查 {len(package_names)} 个软件包的AUR版本...")
+        if self._status_bar is not None:
+            self._status_bar.showMessage(f"正在批量检查 {len(package_names)} 个软件包的AUR版本...")
 
         # 异步执行批量检查
         run_async_task(
@@ -371,46 +400,22 @@ class VersionCheckMixin:
 
         self.logger.info(f"开始检查 {len(selected_packages)} 个选中的软件包的上游版本")
 
+        # 初始化服务
+        self._init_version_services()
+
         # 创建进度条
         progress_bar = None
-        if hasattr(self, "status_bar"):
+        if self._status_bar is not None:
             progress_bar = QProgressBar()
             progress_bar.setMaximum(len(selected_packages))
             progress_bar.setValue(0)
-            self.status_bar.addWidget(progress_bar)
+            self._status_bar.addWidget(progress_bar)
 
-        # 批量检查
-        for i, package in enumerate(selected_packages):
-            name = package.get("name")
-            if not name:
-                continue
-
-            upstream_url = package.get("upstream_url")
-            checker_type = package.get("checker_type")
-            version_extract_key = package.get("version_extract_key")
-
-            self.logger.debug(f"正在检查 [{i+1}/{len(selected_packages)}] {name} 的上游版本")
-            if upstream_url:
-                self.check_package_version(
-                    name=name,
-                    upstream_url=upstream_url,
-                    checker_type=checker_type,
-                    version_extract_key=version_extract_key
-                )
-            else:
-                self.logger.warning(f"软件包 {name} 没有设置上游URL，跳过检查")
-
-            # 更新进度条
-            if progress_bar:
-                progress_bar.setValue(i + 1)
-                self.status_bar.showMessage(f"检查中... {i+1}/{len(selected_packages)}")
-
-        # 完成检查，移除进度条
-        if progress_bar:
-            self.status_bar.removeWidget(progress_bar)
-            self.status_bar.showMessage(f"已完成 {len(selected_packages)} 个软件包的上游版本检查", 3000)
-
-        self.logger.info(f"完成 {len(selected_packages)} 个软件包的上游版本检查")
+        # 一次批量检查所有选中的软件包
+        self._check_upstream_batch(
+            selected_packages, progress_bar,
+            f"已完成 {len(selected_packages)} 个软件包的上游版本检查"
+        )
 
     def check_selected_all_versions(self):
         """检查所有通过复选框或鼠标选择的软件包的所有版本（AUR和上游）"""
@@ -423,16 +428,16 @@ class VersionCheckMixin:
 
         self.logger.info(f"开始检查 {len(selected_packages)} 个选中的软件包的所有版本")
 
+        # 初始化服务
+        self._init_version_services()
+
         # 创建进度条
         progress_bar = None
-        if hasattr(self, "status_bar"):
+        if self._status_bar is not None:
             progress_bar = QProgressBar()
             progress_bar.setMaximum(len(selected_packages))
             progress_bar.setValue(0)
-            self.status_bar.addWidget(progress_bar)
-
-        # 初始化服务
-        self._init_version_services()
+            self._status_bar.addWidget(progress_bar)
 
         # 1. 准备包名列表用于批量AUR查询
         package_names = []
@@ -441,72 +446,114 @@ class VersionCheckMixin:
             if name:
                 package_names.append(name)
 
-        if package_names:
-            # 2. 使用批量API进行AUR异步检查
-            self.logger.info(f"开始批量检查 {len(package_names)} 个软件包的AUR版本")
+        # 2. 准备上游检查所需的软件包信息
+        packages = self._build_upstream_packages(selected_packages)
 
-            from src.modules.async_executor import run_async_task
+        # 3. AUR和上游检查互不依赖，在同一个异步任务中并发执行
+        self.logger.info(f"开始同时检查 {len(package_names)} 个软件包的AUR版本和 {len(packages)} 个软件包的上游版本")
+        if self._status_bar is not None:
+            self._status_bar.showMessage(f"正在批量检查 {len(package_names)} 个软件包的所有版本...")
 
-            # 批量AUR查询完成后再进行上游版本检查
-            def on_aur_batch_completed(results):
-                self.logger.info(f"批量AUR检查完成，结果数: {len(results)}")
+        async def check_all():
+            return await asyncio.gather(
+                self.aur_checker.check_multiple_aur_versions(package_names),
+                self.main_checker.check_multiple_upstream_versions(packages),
+                return_exceptions=True
+            )
 
-                # 现在开始逐个检查上游版本
-                self._check_upstream_for_selected(selected_packages, progress_bar)
+        done_message = f"已完成 {len(selected_packages)} 个软件包的所有版本检查"
 
-            def on_aur_batch_error(error):
-                self.logger.error(f"批量检查AUR版本时发生错误: {str(error)}")
-                # 即使AUR批量检查失败，也继续进行上游版本检查
-                self._check_upstream_for_selected(selected_packages, progress_bar)
+        def on_all_completed(results):
+            self._finish_check_progress(progress_bar, done_message)
 
-            # 更新状态条
-            if hasattr(self, "status_bar"):
-                self.status_bar.showMessage(f"正在批量检查 {len(package_names)} 个软件包的AUR版本...")
+            # 检查结果已由检查器写入数据库，这里只同步内存中的软件包并重绘对应的行
+            for kind, kind_results in zip(("AUR", "上游"), results):
+                if isinstance(kind_results, BaseException):
+                    self.logger.error(f"批量检查{kind}版本时发生错误: {str(kind_results)}")
+                elif kind_results and not self._apply_check_results(kind_results, kind):
+                    self._schedule_refresh()
 
-            # 执行批量AUR检查，完成后会自动检查上游版本
-            run_async_task(
-                self.aur_checker.check_multiple_aur_versions(package_names),
-                on_aur_batch_completed,
-                on_aur_batch_error
-            )
-        else:
-            # 如果没有有效的包名，直接进行上游版本检查
-            self._check_upstream_for_selected(selected_packages, progress_bar)
+        def on_all_error(error):
+            self.logger.error(f"批量检查所有版本时发生错误: {str(error)}")
+            self._finish_check_progress(progress_bar, "检查过程中发生错误")
 
-    def _check_upstream_for_selected(self, selected_packages, progress_bar=None):
-        """检查所选包的上游版本（AUR检查之后的第二阶段）"""
-        self.logger.info(f"开始检查 {len(selected_packages)} 个包的上游版本")
+        run_async_task(check_all(), on_all_completed, on_all_error)
 
-        # 逐个检查上游版本
-        for i, package in enumerate(selected_packages):
+    def _build_upstream_packages(self, selected_packages):
+        """从选中的软件包中整理上游检查所需的信息
+
+        复制软件包信息，检查过程中写入的字段不影响内存中的软件包数据
+
+        Args:
+            selected_packages: 选中的软件包列表
+
+        Returns:
+            list: 带有上游URL的软件包信息列表
+        """
+        packages = []
+        for package in selected_packages:
             name = package.get("name")
             if not name:
                 continue
-
-            # 只检查上游版本
-            upstream_url = package.get("upstream_url")
-            checker_type = package.get("checker_type")
-            version_extract_key = package.get("version_extract_key")
-
-            if upstream_url:
-                self.logger.debug(f"正在检查 [{i+1}/{len(selected_packages)}] {name} 的上游版本")
-                self.check_package_version(
-                    name=name,
-                    upstream_url=upstream_url,
-                    checker_type=checker_type,
-                    version_extract_key=version_extract_key
-                )
-            else:
+            if not package.get("upstream_url"):
                 self.logger.debug(f"软件包 {name} 没有设置上游URL，跳过上游版本检查")
+                continue
+            packages.append({
+                "name": name,
+                "upstream_url": package.get("upstream_url"),
+                "checker_type": package.get("checker_type"),
+                "version_extract_key": package.get("version_extract_key")
+            })
+        return packages
 
-            # 更新进度条
-            if progress_bar:
-                progress_bar.setValue(i + 1)
-                self.status_bar.showMessage(f"检查上游版本... {i+1}/{len(selected_packages)}")
+    def _finish_check_progress(self, progress_bar, message):
+        """检查结束后移除进度条并在状态栏显示消息
+
+        Args:
+            progress_bar: 状态栏中的进度条，可以为None
+            message: 状态栏显示的消息
+        """
+        if progress_bar:
+            self._status_bar.removeWidget(progress_bar)
+            self._status_bar.showMessage(message, 3000)
+
+    def _check_upstream_batch(self, selected_packages, progress_bar, done_message):
+        """通过一次批量调用检查一组软件包的上游版本
+
+        选中的软件包已带有upstream_url、checker_type和version_extract_key，
+        不再逐个查询数据库，也不再为每个软件包单独提交异步任务
+
+        Args:
+            selected_packages: 选中的软件包列表
+            progress_bar: 状态栏中的进度条，可以为None
+            done_message: 检查完成后状态栏显示的消息
+        """
+        self._init_version_services()
+
+        packages = self._build_upstream_packages(selected_packages)
+
+        if not packages:
+            self._finish_check_progress(progress_bar, done_message)
+            return
+
+        self.logger.info(f"开始批量检查 {len(packages)} 个包的上游版本")
+        if progress_bar:
+            self._status_bar.showMessage(f"正在批量检查 {len(packages)} 个软件包的上游版本...")
+
+        def on_batch_completed(results):
+            self._finish_check_progress(progress_bar, done_message)
+            self.logger.info(f"完成 {len(packages)} 个软件包的上游版本检查")
+
+            # 检查结果已由检查器写入数据库，这里只同步内存中的软件包并重绘对应的行
+            if results and not self._apply_check_results(results, "上游"):
+                self._schedule_refresh()
 
-        # 完成检查，移除进度条
-        if progress_bar and hasattr(self, "status_bar"):
-            self.status_bar.removeWidget(progress_bar)
-            self.status_bar.showMessage(f"已完成 {len(selected_packages)} 个软件包的所有版本检查", 3000)
+        def on_batch_error(error):
+            self.logger.error(f"批量检查上游版本时发生错误: {str(error)}")
+            self._finish_check_progress(progress_bar, "检查过程中发生错误")
 
-        self.logger.info(f"完成 {len(selected_packages)} 个软件包的所有版本检查")
+        run_async_task(
+            self.main_checker.check_multiple_upstream_versions(packages),
+            on_batch_completed,
+            on_batch_error
+        )
@@ -3,11 +3,19 @@
 显示设置相关功能
 """
 from PySide6.QtWidgets import (
-    QGroupBox, QVBoxLayout, QTableWidget, QHeaderView,
-    QTableWidgetItem, QComboBox, QCheckBox, QWidget, QHBoxLayout,
-    QFormLayout, QSpinBox  # 添加 QSpinBox
+    QGroupBox, QVBoxLayout, QTableView, QHeaderView,
+    QComboBox, QSpinBox  # 添加 QSpinBox
 )
 from PySide6.QtCore import Qt
+from PySide6.QtGui import QStandardItemModel, QStandardItem
+
+from .form_controls import add_form_group
+
+# 配置值与对齐方式显示文本的映射，下拉框按此顺序添加选项
+_ALIGN_CN = {"left": "左对齐", "center": "居中对齐", "right": "右对齐"}
+# 下拉框选项索引 -> 配置值
+_ALIGNMENT_BY_INDEX = tuple(_ALIGN_CN)
+
 
 def setup_display_tab(self, display_tab):
     """设置显示标签页
@@ -24,9 +32,7 @@ def setup_display_tab(self, display_tab):
     display_layout.addWidget(columns_group)
 
     # 创建表格来显示列设置
-    self.columns_table = QTableWidget()
-    self.columns_table.setColumnCount(4)
-    self.columns_table.setHorizontalHeaderLabels(["序号", "表格列名", "对齐方式", "是否显示"])
+    self.columns_table = QTableView()
     self.columns_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
     self.columns_table.verticalHeader().setVisible(False)
     columns_layout.addWidget(self.columns_table)
@@ -44,49 +50,55 @@ def setup_display_tab(self, display_tab):
         {"name": "备注", "config_key": "notes"}
     ]
 
-    # 填充表格数据
-    self.columns_table.setRowCount(len(self.column_settings))
+    # 一次取出列设置所在的配置子树，逐列读取时不再解析点号键
+    ui_config = self.config.get("ui", {})
+    text_alignment = ui_config.get("text_alignment", {})
+
+    # 先填充模型中的文本单元格，再一次性设置给视图
+    model = QStandardItemModel(len(self.column_settings), 4, self.columns_table)
+    model.setHorizontalHeaderLabels(["序号", "表格列名", "对齐方式", "是否显示"])
     for i, column in enumerate(self.column_settings):
         # 序号
-        index_item = QTableWidgetItem(str(i + 1))
+        index_item = QStandardItem(str(i + 1))
         index_item.setFlags(Qt.ItemIsEnabled)
-        self.columns_table.setItem(i, 0, index_item)
+        model.setItem(i, 0, index_item)
 
         # 列名
-        name_item = QTableWidgetItem(column["name"])
+        name_item = QStandardItem(column["name"])
         name_item.setFlags(Qt.ItemIsEnabled)
-        self.columns_table.setItem(i, 1, name_item)
+        model.setItem(i, 1, name_item)
 
-        # 对齐方式
-        alignment_combo = QComboBox()
-        alignment_combo.addItems(["左对齐", "居中对齐", "右对齐"])
-        current_alignment = self.config.get(f"ui.text_alignment.{column['config_key']}", "left")
-        alignment_combo.setCurrentText({
-            "left": "左对齐",
-            "center": "居中对齐",
-            "right": "右对齐"
-        }[current_alignment])
-        self.columns_table.setCellWidget(i, 2, alignment_combo)
+        # 是否显示：直接使用可勾选的单元格，不再为每行创建复选框控件
+        show_item = QStandardItem()
+        show_item.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
+        show_item.setCheckState(
+            Qt.Checked if ui_config.get(f"show_{column['config_key']}", True) else Qt.Unchecked
+        )
+        model.setItem(i, 3, show_item)
+    model.itemChanged.connect(self._mark_dirty)
+    self.columns_model = model
 
-        # 是否显示
-        show_check = QCheckBox()
-        show_check.setChecked(self.config.get(f"ui.show_{column['config_key']}", True))
-        show_check_widget = QWidget()
-        show_check_layout = QHBoxLayout(show_check_widget)
-        show_check_layout.addWidget(show_check)
-        show_check_layout.setAlignment(Qt.AlignCenter)
-        show_check_layout.setContentsMargins(0, 0, 0, 0)
-        self.columns_table.setCellWidget(i, 3, show_check_widget)
+    # 设置模型后再添加编辑控件，期间冻结刷新和信号，避免逐格重绘
+    table = self.columns_table
+    table.setUpdatesEnabled(False)
+    table.blockSignals(True)
+    try:
+        table.setModel(model)
+        for i, column in enumerate(self.column_settings):
+            # 对齐方式
+            alignment_combo = QComboBox()
+            alignment_combo.addItems(list(_ALIGN_CN.values()))
+            current_alignment = text_alignment.get(column['config_key'], "left")
+            alignment_combo.setCurrentText(_ALIGN_CN.get(current_alignment, _ALIGN_CN["left"]))
+            self._watch_changes(alignment_combo)
+            table.setIndexWidget(model.index(i, 2), alignment_combo)
+    finally:
+        table.blockSignals(False)
+        table.setUpdatesEnabled(True)
+        table.viewport().update()
 
     # UI 设置组
-    ui_group = QGroupBox("界面设置")
-    ui_layout = QVBoxLayout()
-    ui_group.setLayout(ui_layout)
-    display_layout.addWidget(ui_group)
-
-    # UI 设置表单
-    ui_form = QFormLayout()
-    ui_layout.addLayout(ui_form)
+    ui_form = add_form_group(display_layout, "界面设置")
 
     # 字体大小设置
     self.font_size_spin = self._create_form_control(
@@ -3,9 +3,66 @@
 设置表单控件创建模块
 """
 from PySide6.QtWidgets import (
-    QHBoxLayout, QLineEdit, QCheckBox, QSpinBox, QComboBox
+    QLineEdit, QCheckBox, QSpinBox, QComboBox,
+    QGroupBox, QVBoxLayout, QFormLayout
 )
 
+def add_form_group(parent_layout, title):
+    """在布局中添加一个带表单的分组框
+
+    Args:
+        parent_layout: 分组所在的布局
+        title: 分组标题
+
+    Returns:
+        QFormLayout: 分组内的表单布局
+    """
+    group = QGroupBox(title)
+    group_layout = QVBoxLayout(group)
+    parent_layout.addWidget(group)
+
+    form = QFormLayout()
+    group_layout.addLayout(form)
+    return form
+
+def _build_line_edit(config, config_key, default_value, kwargs):
+    control = QLineEdit(**kwargs)
+    control.setText(str(config.get(config_key, default_value)))
+    return control
+
+def _build_check_box(config, config_key, default_value, kwargs):
+    control = QCheckBox(**kwargs)
+    control.setChecked(bool(config.get(config_key, default_value)))
+    return control
+
+def _build_spin_box(config, config_key, default_value, kwargs):
+    control = QSpinBox(**kwargs)
+    control.setValue(int(config.get(config_key, default_value)))
+    return control
+
+def _build_combo_box(config, config_key, default_value, kwargs):
+    # 从kwargs中提取items参数
+    items = kwargs.pop('items', [])
+    control = QComboBox(**kwargs)
+
+    # 添加项目到下拉框
+    if items:
+        control.addItems(items)
+
+    # 设置当前值
+    current_value = config.get(config_key, default_value)
+    if current_value in items:
+        control.setCurrentText(current_value)
+    return control
+
+# 控件类型 -> 创建并按配置初始化控件的函数
+_BUILDERS = {
+    QLineEdit: _build_line_edit,
+    QCheckBox: _build_check_box,
+    QSpinBox: _build_spin_box,
+    QComboBox: _build_combo_box,
+}
+
 def create_form_control(self, parent, label, control_type, config_key, default_value=None, **kwargs):
     """创建表单控件
 
@@ -17,31 +74,26 @@ def create_form_control(self, parent, label, control_type, config_key, default_v
         default_value: 默认值
         kwargs: 控件的额外参数
     """
-    row_layout = QHBoxLayout()
-
-    if control_type == QLineEdit:
-        control = QLineEdit(**kwargs)
-        control.setText(str(self.config.get(config_key, default_value)))
-    elif control_type == QCheckBox:
-        control = QCheckBox(**kwargs)
-        control.setChecked(bool(self.config.get(config_key, default_value)))
-    elif control_type == QSpinBox:
-        control = QSpinBox(**kwargs)
-        control.setValue(int(self.config.get(config_key, default_value)))
-    elif control_type == QComboBox:
-        # 从kwargs中提取items参数
-        items = kwargs.pop('items', [])
-        control = QComboBox(**kwargs)
-
-        # 添加项目到下拉框
-        if items:
-            control.addItems(items)
-
-        # 设置当前值
-        current_value = self.config.get(config_key, default_value)
-        if current_value in items:
-            control.setCurrentText(current_value)
-
-    row_layout.addWidget(control)
-    parent.addRow(label, row_layout)
+    control = _BUILDERS[control_type](self.config, config_key, default_value, kwargs)
+    self._watch_changes(control)
+    parent.addRow(label, control)
     return control
+
+def watch_changes(self, control):
+    """将控件的修改信号连接到脏标记
+
+    Args:
+        control: 需要跟踪修改的控件
+    """
+    if isinstance(control, QLineEdit):
+        control.textChanged.connect(self._mark_dirty)
+    elif isinstance(control, QCheckBox):
+        control.toggled.connect(self._mark_dirty)
+    elif isinstance(control, QSpinBox):
+        control.valueChanged.connect(self._mark_dirty)
+    elif isinstance(control, QComboBox):
+        control.currentTextChanged.connect(self._mark_dirty)
+
+def mark_dirty(self, *args):
+    """标记设置已被修改"""
+    self._dirty = True
@@ -2,8 +2,11 @@
 """
 定时检查设置模块
 """
+import weakref
+from contextlib import ExitStack
+from PySide6.QtCore import Qt, QMetaObject, QSignalBlocker
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QFormLayout, 
+    QVBoxLayout, QHBoxLayout, QFormLayout,
     QPushButton, QCheckBox, QSpinBox, QGroupBox
 )
 
@@ -68,17 +71,29 @@ def setup_scheduler_tab(self, tab):
     # 加载定时检查设置
     self._load_scheduler_settings()
 
+    # 加载完成后再跟踪修改
+    for control in _scheduler_controls(self):
+        self._watch_changes(control)
+
+def _scheduler_controls(self):
+    """返回定时检查设置的全部控件"""
+    return (self.enable_scheduler_check, self.aur_interval_spin, self.upstream_interval_spin,
+            self.check_on_startup_check, self.enable_notification_check)
+
 def _load_scheduler_settings(self):
     """加载定时检查设置"""
     try:
         scheduler_config = self.config.get("scheduler", {})
 
-        # 加载设置
-        self.enable_scheduler_check.setChecked(scheduler_config.get("enabled", True))
-        self.aur_interval_spin.setValue(scheduler_config.get("aur_check_interval", 24))
-        self.upstream_interval_spin.setValue(scheduler_config.get("upstream_check_interval", 48))
-        self.check_on_startup_check.setChecked(scheduler_config.get("check_on_startup", True))
-        self.enable_notification_check.setChecked(scheduler_config.get("notification_enabled", True))
+        # 加载设置，期间屏蔽控件信号，加载的值不会被当作用户修改
+        with ExitStack() as stack:
+            for control in _scheduler_controls(self):
+                stack.enter_context(QSignalBlocker(control))
+            self.enable_scheduler_check.setChecked(scheduler_config.get("enabled", True))
+            self.aur_interval_spin.setValue(scheduler_config.get("aur_check_interval", 24))
+            self.upstream_interval_spin.setValue(scheduler_config.get("upstream_check_interval", 48))
+            self.check_on_startup_check.setChecked(scheduler_config.get("check_on_startup", True))
+            self.enable_notification_check.setChecked(scheduler_config.get("notification_enabled", True))
 
         self.logger.debug("已加载定时检查设置")
     except Exception as e:
@@ -87,33 +102,49 @@ def _load_scheduler_settings(self):
 def _update_scheduler_settings(self):
     """更新定时检查设置到配置"""
     try:
-        # 更新配置
-        self.config.set("scheduler.enabled", self.enable_scheduler_check.isChecked())
-        self.config.set("scheduler.aur_check_interval", self.aur_interval_spin.value())
-        self.config.set("scheduler.upstream_check_interval", self.upstream_interval_spin.value())
-        self.config.set("scheduler.check_on_startup", self.check_on_startup_check.isChecked())
-        self.config.set("scheduler.notification_enabled", self.enable_notification_check.isChecked())
-
-        self.logger.debug("已更新定时检查设置到配置")
+        values = {
+            "enabled": self.enable_scheduler_check.isChecked(),
+            "aur_check_interval": self.aur_interval_spin.value(),
+            "upstream_check_interval": self.upstream_interval_spin.value(),
+            "check_on_startup": self.check_on_startup_check.isChecked(),
+            "notification_enabled": self.enable_notification_check.isChecked(),
+        }
+
+        # 只写入与当前配置不同的项，写盘由save_settings统一完成
+        scheduler_config = self.config.get("scheduler", {})
+        changed = {
+            f"scheduler.{key}": value
+            for key, value in values.items()
+            if key not in scheduler_config or scheduler_config[key] != value
+        }
+        if not changed:
+            return
+
+        self.config.set_many(changed)
+        if self.logger.is_enabled_for("DEBUG"):
+            self.logger.debug(f"已更新定时检查设置到配置: {', '.join(changed)}")
     except Exception as e:
         self.logger.error(f"更新定时检查设置时出错: {str(e)}")
 
+def register_scheduler(self, scheduler):
+    """登记定时检查模块，供立即检查按钮使用
+
+    Args:
+        scheduler: 定时检查模块实例
+    """
+    self._scheduler_ref = weakref.ref(scheduler)
+
 def _check_now(self):
     """立即执行版本检查"""
     try:
-        # 查找主窗口实例
-        from PySide6.QtWidgets import QApplication
-        app = QApplication.instance()
-
-        # 寻找主窗口实例
-        for widget in app.topLevelWidgets():
-            if hasattr(widget, "scheduler"):
-                # 执行立即检查
-                widget.scheduler.check_now()
-                self.logger.info("已触发立即检查")
-                return
-
-        self.logger.warning("未找到主窗口实例，无法执行立即检查")
+        scheduler = self._scheduler_ref() if self._scheduler_ref is not None else None
+        if scheduler is None:
+            self.logger.warning("定时检查模块未登记，无法执行立即检查")
+            return
+
+        # 通过事件循环排队执行，按钮点击立即返回，检查在下一轮事件循环中开始
+        QMetaObject.invokeMethod(scheduler, "check_now", Qt.QueuedConnection)
+        self.logger.info("已触发立即检查")
 
     except Exception as e:
         self.logger.error(f"执行立即检查时出错: {str(e)}")
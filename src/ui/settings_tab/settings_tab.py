@@ -6,10 +6,10 @@ import os
 from PySide6.QtWidgets import QWidget
 from PySide6.QtCore import Signal
 
-from .ui_init import init_ui, select_curl_path
+from .ui_init import init_ui, select_curl_path, build_tab, ensure_tabs_built, FORM_WIDGET_ATTRS
 from .config_operations import save_settings, reset_settings
-from .form_controls import create_form_control
-from .scheduler_settings import _load_scheduler_settings, _update_scheduler_settings, _check_now
+from .form_controls import create_form_control, watch_changes, mark_dirty
+from .scheduler_settings import _load_scheduler_settings, _update_scheduler_settings, _check_now, register_scheduler
 
 class SettingsTab(QWidget):
     """设置标签页"""
@@ -18,6 +18,13 @@ class SettingsTab(QWidget):
     settings_saved = Signal()
     settings_reset = Signal()
 
+    # 各选项卡创建的控件属性，选项卡延迟创建，未创建前为None
+    _WIDGET_ATTRS = FORM_WIDGET_ATTRS + (
+        "columns_table", "columns_model", "font_size_spin", "curl_path_edit",
+        "enable_scheduler_check", "aur_interval_spin", "upstream_interval_spin",
+        "check_on_startup_check", "enable_notification_check", "save_settings_button",
+    )
+
     def __init__(self, config, logger, parent=None):
         """初始化设置标签页
 
@@ -29,11 +36,17 @@ class SettingsTab(QWidget):
         super().__init__(parent)
         self.config = config
         self.logger = logger
+        # 一次性登记所有控件属性
+        self.__dict__.update(dict.fromkeys(self._WIDGET_ATTRS))
+        self._dirty = False
+        self._scheduler_ref = None  # 定时检查模块的弱引用，由主窗口登记
         self.init_ui()
 
     # 从ui_init.py导入方法
     init_ui = init_ui
     select_curl_path = select_curl_path
+    _build_tab = build_tab
+    _ensure_tabs_built = ensure_tabs_built
     
     # 从config_operations.py导入方法
     save_settings = save_settings
@@ -41,8 +54,11 @@ class SettingsTab(QWidget):
     
     # 从form_controls.py导入方法
     _create_form_control = create_form_control
+    _watch_changes = watch_changes
+    _mark_dirty = mark_dirty
 
     # 从scheduler_settings.py导入方法
     _load_scheduler_settings = _load_scheduler_settings
     _update_scheduler_settings = _update_scheduler_settings
     _check_now = _check_now
+    register_scheduler = register_scheduler
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+软件包表格数据模型的测试
+"""
+import os
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+
+from src.ui.main_window.package_table_model import PackageTableModel, is_outdated
+
+
+class PackageTableModelSortTest(unittest.TestCase):
+    """数据库中的NULL字段不影响排序"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.model = PackageTableModel(None)
+        # 从未检查过上游版本的软件包，upstream_version等字段为NULL
+        self.packages = [
+            {"name": "foo", "aur_version": "1.0", "upstream_version": None,
+             "checker_type": None, "upstream_url": None, "notes": None},
+            {"name": "bar", "aur_version": "2.0", "upstream_version": "2.1",
+             "checker_type": "github", "upstream_url": "https://example.com", "notes": "备注"},
+        ]
+        self.model.set_packages(self.packages)
+
+    def test_sort_every_column_with_null_fields(self):
+        for column in range(1, len(PackageTableModel.HEADERS)):
+            for order in (Qt.AscendingOrder, Qt.DescendingOrder):
+                with self.subTest(column=column, order=order):
+                    self.model.sort(column, order)
+                    self.assertEqual(self.model.rowCount(), 2)
+
+    def test_null_fields_sort_first_and_display_empty(self):
+        self.model.sort(3, Qt.AscendingOrder)
+        self.assertEqual(self.model.text(0, 1), "foo")
+        self.assertEqual(self.model.text(0, 3), "")
+        self.assertEqual(self.model.row_of("bar"), 1)
+
+    def test_set_packages_keeps_active_sort(self):
+        self.model.sort(9, Qt.DescendingOrder)
+        self.model.set_packages(list(self.packages))
+        self.assertEqual(self.model.text(0, 1), "bar")
+        self.assertEqual(self.model.text(1, 9), "")
+
+
+class IsOutdatedTest(unittest.TestCase):
+    """过时过滤与状态列的判断保持一致"""
+
+    def test_matches_status_column(self):
+        cases = [
+            ({"aur_version": "1.0", "upstream_version": "1.1"}, True),
+            ({"aur_version": "1.0", "upstream_version": "1.0.0"}, False),  # PEP 440下相等
+            ({"aur_version": "2.0", "upstream_version": "1.9"}, False),    # 超前
+            ({"aur_version": "1.0", "upstream_version": None}, False),     # 未知
+        ]
+        for pkg, expected in cases:
+            with self.subTest(pkg=pkg):
+                self.assertEqual(is_outdated(pkg), expected)
+                self.assertEqual(PackageTableModel.get_status(pkg) == "过时", expected)
+
+
+if __name__ == "__main__":
+    unittest.main()